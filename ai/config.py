@@ -28,6 +28,23 @@ class Settings:
 
     # Database
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./transportation.db")
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "20"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+
+    # Raise on unplanned lazy loads in hot read paths (enable in dev/CI)
+    STRICT_LOADING: bool = os.getenv("STRICT_LOADING", "false").lower() == "true"
+
+    # Worker threads for sync route handlers (AnyIO's default is 40). Defaults
+    # to the DB pool's capacity, so every handler thread can get a connection.
+    THREADPOOL_SIZE: int = int(
+        os.getenv("THREADPOOL_SIZE", str(DB_POOL_SIZE + DB_MAX_OVERFLOW))
+    )
+
+    # Cache (optional - caching is disabled when REDIS_URL is empty)
+    REDIS_URL: str = os.getenv("REDIS_URL", "")
+    REDIS_MAX_CONNECTIONS: int = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
 
     @classmethod
     def validate(cls):
@@ -49,6 +49,7 @@ from crud.route_segment import (
     get_route_segment_by_shape_id,
     get_route_segment_by_stops,
     get_route_segments,
+    get_route_segments_by_stop_pairs,
     update_route_segment,
 )
 from crud.route_stop import (
@@ -56,6 +57,7 @@ from crud.route_stop import (
     delete_route_stop,
     get_route_stop,
     get_route_stops,
+    get_route_stops_by_route_id,
     update_route_stop,
 )
 from crud.shape_point import (
@@ -64,8 +66,13 @@ from crud.shape_point import (
     delete_all_shape_points,
     delete_shape_point,
     get_shape_point,
+    get_shape_point_coords_by_shape_ids,
+    get_shape_point_rows_by_shape_id,
     get_shape_points,
     get_shape_points_by_shape_id,
+    get_shape_points_json,
+    get_shape_points_json_by_shape_ids,
+    refresh_shape_points_json,
     update_shape_point,
 )
 from crud.stop import create_stop, delete_stop, get_stop, get_stops, update_stop
@@ -82,19 +89,31 @@ from crud.user import create_user, delete_user, get_user, get_users, update_user
 from crud.user_journey import (
     create_user_journey,
     delete_user_journey,
+    delete_user_journey_for_user,
+    end_user_journey_for_user,
     get_user_active_journey,
     get_user_journey,
+    get_user_journey_for_user,
+    get_user_journey_owner_id,
+    get_user_journey_with_stops_for_user,
     get_user_journeys,
     get_user_saved_journeys,
+    start_user_journey_for_user,
     update_user_journey,
+    update_user_journey_for_user,
+    user_journey_has_feedback,
 )
 from crud.user_journey_stop import (
     create_user_journey_stop,
     delete_all_user_journey_stops,
     delete_user_journey_stop,
+    delete_user_journey_stop_for_user,
+    delete_user_journey_stops_for_user,
     get_user_journey_stop,
+    get_user_journey_stop_ids,
     get_user_journey_stops,
     update_user_journey_stop,
+    update_user_journey_stop_for_user,
 )
 from crud.vehicle import (
     create_vehicle,
@@ -139,6 +158,7 @@ __all__ = [
     "create_route_stop",
     "get_route_stop",
     "get_route_stops",
+    "get_route_stops_by_route_id",
     "update_route_stop",
     "delete_route_stop",
     # VehicleTrip
@@ -203,17 +223,29 @@ __all__ = [
     # User Journey
     "create_user_journey",
     "get_user_journey",
+    "get_user_journey_for_user",
+    "get_user_journey_owner_id",
+    "get_user_journey_with_stops_for_user",
     "get_user_journeys",
     "get_user_saved_journeys",
     "get_user_active_journey",
     "update_user_journey",
+    "update_user_journey_for_user",
     "delete_user_journey",
+    "delete_user_journey_for_user",
+    "start_user_journey_for_user",
+    "end_user_journey_for_user",
+    "user_journey_has_feedback",
     # User Journey Stop
     "create_user_journey_stop",
     "get_user_journey_stop",
     "get_user_journey_stops",
+    "get_user_journey_stop_ids",
     "update_user_journey_stop",
+    "update_user_journey_stop_for_user",
     "delete_user_journey_stop",
+    "delete_user_journey_stop_for_user",
+    "delete_user_journey_stops_for_user",
     "delete_all_user_journey_stops",
     # Route Segment
     "create_route_segment",
@@ -221,14 +253,20 @@ __all__ = [
     "get_route_segment_by_shape_id",
     "get_route_segment_by_stops",
     "get_route_segments",
+    "get_route_segments_by_stop_pairs",
     "update_route_segment",
     "delete_route_segment",
     # Shape Point
     "create_shape_point",
     "create_shape_points_batch",
     "get_shape_point",
+    "get_shape_point_coords_by_shape_ids",
+    "get_shape_point_rows_by_shape_id",
     "get_shape_points",
     "get_shape_points_by_shape_id",
+    "get_shape_points_json",
+    "get_shape_points_json_by_shape_ids",
+    "refresh_shape_points_json",
     "update_shape_point",
     "delete_shape_point",
     "delete_all_shape_points",
@@ -3,10 +3,11 @@ Functions for real-time journey tracking and progress calculation.
 """
 
 from math import asin, cos, radians, sin, sqrt
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
-from db_models import RouteSegment, ShapePoint, Stop, UserJourneyStop
-from sqlalchemy.orm import Session
+from db_models import RouteSegment, ShapePoint, UserJourneyStop
+from sqlalchemy import and_, func, select, tuple_
+from sqlalchemy.orm import Session, joinedload
 
 
 def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -29,6 +30,104 @@ def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return c * r
 
 
+def _get_journey_stops_with_stop(
+    db: Session, user_journey_id: str
+) -> List[UserJourneyStop]:
+    """Get journey stops ordered by stop_order, with their Stop joined in."""
+    return (
+        db.query(UserJourneyStop)
+        .options(joinedload(UserJourneyStop.stop))
+        .filter(UserJourneyStop.user_journey_id == user_journey_id)
+        .order_by(UserJourneyStop.stop_order)
+        .all()
+    )
+
+
+def _get_segment_distances(
+    db: Session, stop_pairs: List[Tuple[str, str]]
+) -> Dict[Tuple[str, str], float]:
+    """
+    Get the shape length (last point's shape_dist_traveled) of the route
+    segment for each (from_stop_id, to_stop_id) pair, in a single query.
+
+    Pairs without a segment or without a distance are left out.
+    """
+    if not stop_pairs:
+        return {}
+
+    pair_filter = tuple_(RouteSegment.from_stop_id, RouteSegment.to_stop_id).in_(
+        set(stop_pairs)
+    )
+    segment_shape_ids = select(RouteSegment.shape_id).where(pair_filter)
+    # Last point of each matching segment's shape (an index seek per shape)
+    last_sequence = (
+        select(
+            ShapePoint.shape_id,
+            func.max(ShapePoint.shape_pt_sequence).label("sequence"),
+        )
+        .where(ShapePoint.shape_id.in_(segment_shape_ids))
+        .group_by(ShapePoint.shape_id)
+        .subquery()
+    )
+    rows = db.execute(
+        select(
+            RouteSegment.from_stop_id,
+            RouteSegment.to_stop_id,
+            ShapePoint.shape_dist_traveled,
+        )
+        .join(last_sequence, last_sequence.c.shape_id == RouteSegment.shape_id)
+        .join(
+            ShapePoint,
+            and_(
+                ShapePoint.shape_id == last_sequence.c.shape_id,
+                ShapePoint.shape_pt_sequence == last_sequence.c.sequence,
+            ),
+        )
+        .where(pair_filter, ShapePoint.shape_dist_traveled.is_not(None))
+    )
+    return {
+        (str(from_stop_id), str(to_stop_id)): float(distance)
+        for from_stop_id, to_stop_id, distance in rows
+    }
+
+
+def _sum_route_distance(db: Session, journey_stops: List[UserJourneyStop]) -> float:
+    """
+    Sum segment distances along consecutive journey stops.
+
+    Uses the route segment's shape length where known and falls back to the
+    straight-line distance between the two stops otherwise.
+    """
+    stop_pairs = [
+        (str(from_stop.stop_id), str(to_stop.stop_id))
+        for from_stop, to_stop in zip(journey_stops, journey_stops[1:])
+    ]
+    segment_distances = _get_segment_distances(db, stop_pairs)
+
+    total_distance = 0.0
+    for from_journey_stop, to_journey_stop in zip(journey_stops, journey_stops[1:]):
+        segment_distance = segment_distances.get(
+            (str(from_journey_stop.stop_id), str(to_journey_stop.stop_id))
+        )
+        if segment_distance is not None:
+            total_distance += segment_distance
+            continue
+
+        # Fallback: straight-line distance between stops
+        from_stop = from_journey_stop.stop
+        to_stop = to_journey_stop.stop
+
+        if from_stop and to_stop:
+            total_distance += calculate_distance(
+                float(from_stop.latitude),  # type: ignore
+                float(from_stop.longitude),  # type: ignore
+                float(to_stop.latitude),  # type: ignore
+                float(to_stop.longitude),  # type: ignore
+            )
+
+    return total_distance
+
+
 def find_nearest_stop_on_journey(
     db: Session,
     user_journey_id: str,
@@ -39,12 +138,7 @@ def find_nearest_stop_on_journey(
     Find the nearest stop on the user's journey based on current GPS position.
     Returns dict with stop info and distance.
     """
-    journey_stops = (
-        db.query(UserJourneyStop)
-        .filter(UserJourneyStop.user_journey_id == user_journey_id)
-        .order_by(UserJourneyStop.stop_order)
-        .all()
-    )
+    journey_stops = _get_journey_stops_with_stop(db, user_journey_id)
 
     if not journey_stops:
         return None
@@ -53,7 +147,7 @@ def find_nearest_stop_on_journey(
     min_distance = float("inf")
 
     for journey_stop in journey_stops:
-        stop = db.query(Stop).filter(Stop.id == str(journey_stop.stop_id)).first()
+        stop = journey_stop.stop
         if not stop:
             continue
 
@@ -83,61 +177,22 @@ def calculate_total_route_distance(
     Calculate total distance of the journey using route segments and shape points.
     Returns distance in meters.
     """
-    journey_stops = (
-        db.query(UserJourneyStop)
-        .filter(UserJourneyStop.user_journey_id == user_journey_id)
-        .order_by(UserJourneyStop.stop_order)
-        .all()
+    return calculate_route_distance(
+        db, _get_journey_stops_with_stop(db, user_journey_id)
     )
 
+
+def calculate_route_distance(
+    db: Session, journey_stops: List[UserJourneyStop]
+) -> float:
+    """
+    Calculate total distance along already loaded journey stops (in stop_order,
+    with their Stop loaded). Returns distance in meters.
+    """
     if len(journey_stops) < 2:
         return 0.0
 
-    total_distance = 0.0
-
-    for i in range(len(journey_stops) - 1):
-        from_stop_id = str(journey_stops[i].stop_id)
-        to_stop_id = str(journey_stops[i + 1].stop_id)
-
-        # Try to get precise distance from route segment
-        segment = (
-            db.query(RouteSegment)
-            .filter(
-                RouteSegment.from_stop_id == from_stop_id,
-                RouteSegment.to_stop_id == to_stop_id,
-            )
-            .first()
-        )
-
-        if segment:
-            # Get last shape point's distance_traveled
-            last_point = (
-                db.query(ShapePoint)
-                .filter(ShapePoint.shape_id == segment.shape_id)
-                .order_by(ShapePoint.shape_pt_sequence.desc())
-                .first()
-            )
-
-            if last_point:
-                dist_traveled = last_point.shape_dist_traveled
-                if dist_traveled is not None:
-                    total_distance += float(dist_traveled)  # type: ignore
-                    continue
-
-        # Fallback: straight-line distance between stops
-        from_stop = db.query(Stop).filter(Stop.id == from_stop_id).first()
-        to_stop = db.query(Stop).filter(Stop.id == to_stop_id).first()
-
-        if from_stop and to_stop:
-            distance = calculate_distance(
-                float(from_stop.latitude),  # type: ignore
-                float(from_stop.longitude),  # type: ignore
-                float(to_stop.latitude),  # type: ignore
-                float(to_stop.longitude),  # type: ignore
-            )
-            total_distance += distance
-
-    return total_distance
+    return _sum_route_distance(db, journey_stops)
 
 
 def calculate_remaining_distance(
@@ -151,12 +206,7 @@ def calculate_remaining_distance(
     Calculate remaining distance to next stop and to journey end.
     Returns dict with distances in meters.
     """
-    journey_stops = (
-        db.query(UserJourneyStop)
-        .filter(UserJourneyStop.user_journey_id == user_journey_id)
-        .order_by(UserJourneyStop.stop_order)
-        .all()
-    )
+    journey_stops = _get_journey_stops_with_stop(db, user_journey_id)
 
     if not journey_stops or current_stop_index >= len(journey_stops):
         return {
@@ -168,7 +218,7 @@ def calculate_remaining_distance(
     # Distance to next stop
     next_stop_index = current_stop_index
     next_journey_stop = journey_stops[next_stop_index]
-    next_stop = db.query(Stop).filter(Stop.id == str(next_journey_stop.stop_id)).first()
+    next_stop = next_journey_stop.stop
 
     distance_to_next = None
     if next_stop:
@@ -181,47 +231,7 @@ def calculate_remaining_distance(
 
     # Distance to end (sum of remaining segments + current distance)
     distance_to_end = distance_to_next if distance_to_next else 0.0
-
-    for i in range(next_stop_index, len(journey_stops) - 1):
-        from_stop_id = str(journey_stops[i].stop_id)
-        to_stop_id = str(journey_stops[i + 1].stop_id)
-
-        # Try route segment first
-        segment = (
-            db.query(RouteSegment)
-            .filter(
-                RouteSegment.from_stop_id == from_stop_id,
-                RouteSegment.to_stop_id == to_stop_id,
-            )
-            .first()
-        )
-
-        if segment:
-            last_point = (
-                db.query(ShapePoint)
-                .filter(ShapePoint.shape_id == segment.shape_id)
-                .order_by(ShapePoint.shape_pt_sequence.desc())
-                .first()
-            )
-
-            if last_point:
-                dist_traveled = last_point.shape_dist_traveled
-                if dist_traveled is not None:
-                    distance_to_end += float(dist_traveled)  # type: ignore
-                    continue
-
-        # Fallback: straight-line
-        from_stop = db.query(Stop).filter(Stop.id == from_stop_id).first()
-        to_stop = db.query(Stop).filter(Stop.id == to_stop_id).first()
-
-        if from_stop and to_stop:
-            dist = calculate_distance(
-                float(from_stop.latitude),  # type: ignore
-                float(from_stop.longitude),  # type: ignore
-                float(to_stop.latitude),  # type: ignore
-                float(to_stop.longitude),  # type: ignore
-            )
-            distance_to_end += dist
+    distance_to_end += _sum_route_distance(db, journey_stops[next_stop_index:])
 
     return {
         "distance_to_next_stop": distance_to_next,
@@ -3,6 +3,7 @@ from typing import List, Optional
 
 import db_models
 from models import ReportCreate, ReportUpdate
+from sqlalchemy import bindparam, lambda_stmt, select
 from sqlalchemy.orm import Session
 
 
@@ -24,11 +25,28 @@ def create_report(
 
 
 def get_report(db: Session, report_id: str) -> Optional[db_models.Report]:
-    return db.query(db_models.Report).filter(db_models.Report.id == report_id).first()
+    # Hot PK lookup: lambda_stmt caches the compiled SQL for the process
+    stmt = lambda_stmt(
+        lambda: select(db_models.Report).where(db_models.Report.id == bindparam("id"))
+    )
+    return db.execute(stmt, {"id": report_id}).scalar_one_or_none()
+
 
+def get_reports(
+    db: Session, skip: int = 0, limit: int = 100, after: Optional[str] = None
+) -> List[db_models.Report]:
+    """
+    List reports ordered by id.
 
-def get_reports(db: Session, skip: int = 0, limit: int = 100) -> List[db_models.Report]:
-    return db.query(db_models.Report).offset(skip).limit(limit).all()
+    Pass ``after`` (the last id of the previous page) for keyset pagination,
+    which stays fast on deep pages; ``skip`` is kept for existing clients.
+    """
+    query = db.query(db_models.Report).order_by(db_models.Report.id)
+    if after is not None:
+        query = query.filter(db_models.Report.id > after)
+    else:
+        query = query.offset(skip)
+    return query.limit(limit).all()
 
 
 def get_reports_by_vehicle_trip(
@@ -61,6 +79,7 @@ def get_reports_by_vehicle(
     return (
         db.query(db_models.Report)
         .filter(db_models.Report.vehicle_id == vehicle_id)
+        .order_by(db_models.Report.created_at.desc())
         .offset(skip)
         .limit(limit)
         .all()
@@ -73,6 +92,7 @@ def get_reports_by_category(
     return (
         db.query(db_models.Report)
         .filter(db_models.Report.category == category)
+        .order_by(db_models.Report.created_at.desc())
         .offset(skip)
         .limit(limit)
         .all()
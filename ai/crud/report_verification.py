@@ -3,10 +3,12 @@ CRUD operations for report verification system.
 """
 
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Optional
 
 from db_models import JourneyData, Report, ReportVerification, User, UserJourney
 from sqlalchemy import and_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 
@@ -69,27 +71,37 @@ def get_users_on_vehicle_trip(
 
 def create_report_verification(
     db: Session, report_id: str, user_id: str, verified: bool
-) -> ReportVerification:
+) -> Optional[str]:
     """
     Create a verification entry for a report.
 
+    Issues a single INSERT ... ON CONFLICT (report_id, user_id) DO NOTHING,
+    so duplicate verifications are rejected atomically by the unique
+    constraint instead of a separate existence check.
+
     Args:
         report_id: Report ID
         user_id: User who is verifying
         verified: True = confirm, False = deny
 
     Returns:
-        Created ReportVerification
+        ID of the created ReportVerification, or None if the user
+        has already verified this report
     """
-    db_verification = ReportVerification(
-        report_id=report_id,
-        user_id=user_id,
-        verified=verified,
+    if db.get_bind().dialect.name == "postgresql":
+        insert = postgresql_insert
+    else:
+        insert = sqlite_insert
+
+    stmt = (
+        insert(ReportVerification)
+        .values(report_id=report_id, user_id=user_id, verified=verified)
+        .on_conflict_do_nothing(index_elements=["report_id", "user_id"])
+        .returning(ReportVerification.id)
     )
-    db.add(db_verification)
+    verification_id = db.execute(stmt).scalar_one_or_none()
     db.commit()
-    db.refresh(db_verification)
-    return db_verification
+    return verification_id
 
 
 def get_report_verifications(db: Session, report_id: str) -> List[ReportVerification]:
@@ -17,8 +17,21 @@ def get_route(db: Session, route_id: str) -> Optional[db_models.Route]:
     return db.query(db_models.Route).filter(db_models.Route.id == route_id).first()
 
 
-def get_routes(db: Session, skip: int = 0, limit: int = 100) -> List[db_models.Route]:
-    return db.query(db_models.Route).offset(skip).limit(limit).all()
+def get_routes(
+    db: Session, skip: int = 0, limit: int = 100, after: Optional[str] = None
+) -> List[db_models.Route]:
+    """
+    List routes ordered by id.
+
+    Pass ``after`` (the last id of the previous page) for keyset pagination,
+    which stays fast on deep pages; ``skip`` is kept for existing clients.
+    """
+    query = db.query(db_models.Route).order_by(db_models.Route.id)
+    if after is not None:
+        query = query.filter(db_models.Route.id > after)
+    else:
+        query = query.offset(skip)
+    return query.limit(limit).all()
 
 
 def update_route(
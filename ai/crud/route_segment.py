@@ -1,7 +1,9 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import db_models
+from crud.shape_point import refresh_shape_points_json
 from models import RouteSegmentCreate, RouteSegmentUpdate
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Session
 
 
@@ -47,6 +49,34 @@ def get_route_segment_by_stops(
     )
 
 
+def get_route_segments_by_stop_pairs(
+    db: Session, stop_pairs: List[Tuple[str, str]]
+) -> Dict[Tuple[str, str], db_models.RouteSegment]:
+    """
+    Get route segments for many (from_stop_id, to_stop_id) pairs in one query.
+
+    Pairs without a segment are missing from the returned dict.
+    """
+    if not stop_pairs:
+        return {}
+
+    segments = (
+        db.query(db_models.RouteSegment)
+        .filter(
+            tuple_(
+                db_models.RouteSegment.from_stop_id,
+                db_models.RouteSegment.to_stop_id,
+            ).in_(set(stop_pairs))
+        )
+        .all()
+    )
+    by_pair: Dict[Tuple[str, str], db_models.RouteSegment] = {}
+    for segment in segments:
+        pair = (str(segment.from_stop_id), str(segment.to_stop_id))
+        by_pair.setdefault(pair, segment)
+    return by_pair
+
+
 def get_route_segments(
     db: Session, skip: int = 0, limit: int = 100
 ) -> List[db_models.RouteSegment]:
@@ -61,9 +91,17 @@ def update_route_segment(
         return None
 
     update_data = segment_update.model_dump(exclude_unset=True)
+    shape_changed = (
+        "shape_id" in update_data and update_data["shape_id"] != db_segment.shape_id
+    )
     for field, value in update_data.items():
         setattr(db_segment, field, value)
 
+    if shape_changed:
+        # The precomputed points JSON belongs to the old shape
+        db.flush()
+        refresh_shape_points_json(db, db_segment.shape_id)
+
     db.commit()
     db.refresh(db_segment)
     return db_segment
@@ -2,6 +2,7 @@ from typing import List, Optional
 
 import db_models
 from models import RouteStopCreate, RouteStopUpdate
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 
@@ -27,6 +28,24 @@ def get_route_stops(
     return db.query(db_models.RouteStop).offset(skip).limit(limit).all()
 
 
+def get_route_stops_by_route_id(
+    db: Session, route_id: str
+) -> List[db_models.RouteStop]:
+    """Get a route's stops in schedule order (arrival, else departure time)."""
+    route_stop = db_models.RouteStop
+    return (
+        db.query(route_stop)
+        .filter(route_stop.route_id == route_id)
+        .order_by(
+            func.coalesce(
+                route_stop.scheduled_arrival, route_stop.scheduled_departure
+            ).nulls_last(),
+            route_stop.stop_sequence,
+        )
+        .all()
+    )
+
+
 def update_route_stop(
     db: Session, route_stop_id: str, route_stop_update: RouteStopUpdate
 ) -> Optional[db_models.RouteStop]:
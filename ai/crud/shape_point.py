@@ -1,9 +1,38 @@
-from typing import List, Optional
+from itertools import groupby
+from typing import Dict, List, Optional
 
 import db_models
+import orjson
 from models import ShapePointCreate, ShapePointUpdate
 from sqlalchemy.orm import Session
 
+SHAPE_POINT_FIELDS = (
+    "id",
+    "shape_id",
+    "shape_pt_lat",
+    "shape_pt_lon",
+    "shape_pt_sequence",
+    "shape_dist_traveled",
+    "created_at",
+)
+
+
+def _dump_shape_point_rows(rows: List[tuple]) -> str:
+    return orjson.dumps([dict(zip(SHAPE_POINT_FIELDS, row)) for row in rows]).decode()
+
+
+def refresh_shape_points_json(db: Session, shape_id: str) -> str:
+    """
+    Rebuild the precomputed points JSON stored on the shape's route segment.
+
+    Does not commit; callers commit together with their own changes.
+    """
+    points_json = _dump_shape_point_rows(get_shape_point_rows_by_shape_id(db, shape_id))
+    db.query(db_models.RouteSegment).filter(
+        db_models.RouteSegment.shape_id == shape_id
+    ).update({"shape_points_json": points_json}, synchronize_session=False)
+    return points_json
+
 
 def create_shape_point(
     db: Session, shape_id: str, point: ShapePointCreate
@@ -12,6 +41,8 @@ def create_shape_point(
     point_data["shape_id"] = shape_id
     db_point = db_models.ShapePoint(**point_data)
     db.add(db_point)
+    db.flush()
+    refresh_shape_points_json(db, shape_id)
     db.commit()
     db.refresh(db_point)
     return db_point
@@ -29,6 +60,8 @@ def create_shape_points_batch(
         db_points.append(db_point)
 
     db.add_all(db_points)
+    db.flush()
+    refresh_shape_points_json(db, shape_id)
     db.commit()
     for db_point in db_points:
         db.refresh(db_point)
@@ -55,10 +88,120 @@ def get_shape_points_by_shape_id(
     )
 
 
+def get_shape_point_coords_by_shape_ids(
+    db: Session, shape_ids: List[str]
+) -> Dict[str, List[tuple]]:
+    """
+    Get points for many shapes in one query, grouped by shape_id.
+
+    Each point is a plain (lat, lon, sequence, dist_traveled) tuple, ordered
+    by sequence, so large routes skip ORM object construction. Rows are
+    fetched in batches rather than materialized as one list first.
+    """
+    if not shape_ids:
+        return {}
+
+    point = db_models.ShapePoint
+    rows = (
+        db.query(
+            point.shape_id,
+            point.shape_pt_lat,
+            point.shape_pt_lon,
+            point.shape_pt_sequence,
+            point.shape_dist_traveled,
+        )
+        .filter(point.shape_id.in_(set(shape_ids)))
+        .order_by(point.shape_id, point.shape_pt_sequence)
+        .yield_per(1000)
+    )
+    return {
+        shape_id: [tuple(row)[1:] for row in group]
+        for shape_id, group in groupby(rows, key=lambda row: str(row[0]))
+    }
+
+
+def get_shape_point_rows_by_shape_id(db: Session, shape_id: str) -> List[tuple]:
+    """
+    Get all points for a shape as plain column tuples, ordered by sequence.
+
+    Skips ORM object construction for endpoints that serialize thousands of
+    points straight to JSON.
+    """
+    point = db_models.ShapePoint
+    return [
+        tuple(row)
+        for row in db.query(
+            point.id,
+            point.shape_id,
+            point.shape_pt_lat,
+            point.shape_pt_lon,
+            point.shape_pt_sequence,
+            point.shape_dist_traveled,
+            point.created_at,
+        )
+        .filter(point.shape_id == shape_id)
+        .order_by(point.shape_pt_sequence)
+    ]
+
+
+def get_shape_points_json(db: Session, shape_id: str) -> Optional[str]:
+    """
+    Get the JSON array of points for a shape.
+
+    Served from the route segment's precomputed column when it is set;
+    otherwise (no segment, or one created before the column existed) the
+    points are read from shape_points. Read-only: nothing is backfilled here.
+    Returns None if the shape has neither a segment nor any points.
+    """
+    row = (
+        db.query(db_models.RouteSegment.shape_points_json)
+        .filter(db_models.RouteSegment.shape_id == shape_id)
+        .first()
+    )
+    if row is not None and row[0] is not None:
+        return row[0]
+    rows = get_shape_point_rows_by_shape_id(db, shape_id)
+    if not rows and row is None:
+        return None
+    return _dump_shape_point_rows(rows)
+
+
+def get_shape_points_json_by_shape_ids(
+    db: Session, shape_ids: List[str]
+) -> Dict[str, Optional[str]]:
+    """
+    Get the precomputed points JSON of many shapes' segments in one query.
+
+    Every shape-point write rebuilds the column, so the values double as a
+    version of each shape's geometry. Shapes without a segment are omitted.
+    """
+    if not shape_ids:
+        return {}
+
+    segment = db_models.RouteSegment
+    return {
+        str(shape_id): points_json
+        for shape_id, points_json in db.query(
+            segment.shape_id, segment.shape_points_json
+        ).filter(segment.shape_id.in_(set(shape_ids)))
+    }
+
+
 def get_shape_points(
-    db: Session, skip: int = 0, limit: int = 100
+    db: Session, skip: int = 0, limit: int = 100, after: Optional[str] = None
 ) -> List[db_models.ShapePoint]:
-    return db.query(db_models.ShapePoint).offset(skip).limit(limit).all()
+    """
+    List shape points ordered by id.
+
+    Pass ``after`` (the last id of the previous page) for keyset pagination,
+    which stays fast on deep pages; ``skip`` is kept for existing clients.
+    """
+    query = db.query(db_models.ShapePoint).order_by(db_models.ShapePoint.id)
+    if after is not None:
+        query = query.filter(db_models.ShapePoint.id > after)
+    else:
+        query = query.offset(skip)
+    return query.limit(limit).all()
 
 
 def update_shape_point(
@@ -72,6 +215,8 @@ def update_shape_point(
     for field, value in update_data.items():
         setattr(db_point, field, value)
 
+    db.flush()
+    refresh_shape_points_json(db, str(db_point.shape_id))
     db.commit()
     db.refresh(db_point)
     return db_point
@@ -82,6 +227,8 @@ def delete_shape_point(db: Session, point_id: str) -> bool:
     if not db_point:
         return False
     db.delete(db_point)
+    db.flush()
+    refresh_shape_points_json(db, str(db_point.shape_id))
     db.commit()
     return True
 
@@ -93,5 +240,6 @@ def delete_all_shape_points(db: Session, shape_id: str) -> int:
         .filter(db_models.ShapePoint.shape_id == shape_id)
         .delete()
     )
+    refresh_shape_points_json(db, shape_id)
     db.commit()
     return result
@@ -2,6 +2,7 @@ from typing import List, Optional
 
 import db_models
 from models import StopCreate, StopUpdate
+from sqlalchemy import bindparam, lambda_stmt, select
 from sqlalchemy.orm import Session
 
 
@@ -14,11 +15,27 @@ def create_stop(db: Session, stop: StopCreate) -> db_models.Stop:
 
 
 def get_stop(db: Session, stop_id: str) -> Optional[db_models.Stop]:
-    return db.query(db_models.Stop).filter(db_models.Stop.id == stop_id).first()
-
-
-def get_stops(db: Session, skip: int = 0, limit: int = 100) -> List[db_models.Stop]:
-    return db.query(db_models.Stop).offset(skip).limit(limit).all()
+    stmt = lambda_stmt(
+        lambda: select(db_models.Stop).where(db_models.Stop.id == bindparam("id"))
+    )
+    return db.execute(stmt, {"id": stop_id}).scalar_one_or_none()
+
+
+def get_stops(
+    db: Session, skip: int = 0, limit: int = 100, after: Optional[str] = None
+) -> List[db_models.Stop]:
+    """
+    List stops ordered by id.
+
+    Pass ``after`` (the last id of the previous page) for keyset pagination,
+    which stays fast on deep pages; ``skip`` is kept for existing clients.
+    """
+    query = db.query(db_models.Stop).order_by(db_models.Stop.id)
+    if after is not None:
+        query = query.filter(db_models.Stop.id > after)
+    else:
+        query = query.offset(skip)
+    return query.limit(limit).all()
 
 
 def update_stop(
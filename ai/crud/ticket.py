@@ -3,6 +3,7 @@ from typing import List, Optional
 
 import db_models
 from models import TicketCreate, TicketUpdate
+from sqlalchemy import bindparam, lambda_stmt, select
 from sqlalchemy.orm import Session
 
 
@@ -19,7 +20,10 @@ def create_ticket(
 
 
 def get_ticket(db: Session, ticket_id: str) -> Optional[db_models.Ticket]:
-    return db.query(db_models.Ticket).filter(db_models.Ticket.id == ticket_id).first()
+    stmt = lambda_stmt(
+        lambda: select(db_models.Ticket).where(db_models.Ticket.id == bindparam("id"))
+    )
+    return db.execute(stmt, {"id": ticket_id}).scalar_one_or_none()
 
 
 def get_tickets(
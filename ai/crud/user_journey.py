@@ -1,20 +1,31 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import db_models
 from models import UserJourneyCreate, UserJourneyUpdate
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, insert, tuple_, update
+from sqlalchemy.orm import Session, raiseload, selectinload
 
 
 def create_user_journey(
-    db: Session, user_journey: UserJourneyCreate, user_id: str
+    db: Session,
+    user_journey: UserJourneyCreate,
+    user_id: str,
+    notification_time: Optional[datetime] = None,
 ) -> db_models.UserJourney:
     journey_data = user_journey.model_dump()
     journey_data["user_id"] = user_id
-    db_user_journey = db_models.UserJourney(**journey_data)
-    db.add(db_user_journey)
+    journey_data["notification_time"] = notification_time
+
+    # Single INSERT ... RETURNING instead of INSERT followed by a refresh SELECT
+    db_user_journey = db.scalars(
+        insert(db_models.UserJourney)
+        .values(**journey_data)
+        .returning(db_models.UserJourney)
+    ).one()
+    # Detach before commit so the returned values are not expired and reloaded
+    db.expunge(db_user_journey)
     db.commit()
-    db.refresh(db_user_journey)
     return db_user_journey
 
 
@@ -26,22 +37,92 @@ def get_user_journey(db: Session, journey_id: str) -> Optional[db_models.UserJou
     )
 
 
+def get_user_journey_for_user(
+    db: Session, journey_id: str, user_id: str
+) -> Optional[db_models.UserJourney]:
+    """Get a journey only if it belongs to the user (None if missing or not owned)."""
+    return (
+        db.query(db_models.UserJourney)
+        .filter(
+            db_models.UserJourney.id == journey_id,
+            db_models.UserJourney.user_id == user_id,
+        )
+        .first()
+    )
+
+
+def get_user_journey_owner_id(db: Session, journey_id: str) -> Optional[str]:
+    """Get only the owner's user_id of a journey (None if it doesn't exist)."""
+    user_id = (
+        db.query(db_models.UserJourney.user_id)
+        .filter(db_models.UserJourney.id == journey_id)
+        .scalar()
+    )
+    return str(user_id) if user_id is not None else None
+
+
+def get_user_journey_with_stops_for_user(
+    db: Session, journey_id: str, user_id: str, strict: bool = False
+) -> Optional[db_models.UserJourney]:
+    """
+    Get an owned journey with its stops (ordered by stop_order) preloaded,
+    each with its Stop joined in.
+
+    With ``strict``, touching any other relationship of the journey or its
+    stops raises instead of silently issuing a lazy-load query.
+    """
+    stops = selectinload(db_models.UserJourney.stops)
+    options = [stops.joinedload(db_models.UserJourneyStop.stop)]
+    if strict:
+        options += [stops.raiseload("*"), raiseload("*")]
+    return (
+        db.query(db_models.UserJourney)
+        .options(*options)
+        .filter(
+            db_models.UserJourney.id == journey_id,
+            db_models.UserJourney.user_id == user_id,
+        )
+        .first()
+    )
+
+
 def get_user_journeys(
-    db: Session, user_id: str, skip: int = 0, limit: int = 100
+    db: Session,
+    user_id: str,
+    skip: int = 0,
+    limit: int = 100,
+    before: Optional[Tuple[datetime, str]] = None,
+    strict: bool = False,
 ) -> List[db_models.UserJourney]:
+    """
+    Get a user's journeys, newest first.
+
+    ``before`` is the (created_at, id) of the last journey on the previous
+    page; when given, the page is found with an index seek instead of OFFSET.
+    With ``strict``, lazy-loading any relationship of the results raises.
+    """
+    journey = db_models.UserJourney
+    query = db.query(journey).filter(journey.user_id == user_id)
+    if strict:
+        query = query.options(raiseload("*"))
+    if before is not None:
+        query = query.filter(tuple_(journey.created_at, journey.id) < tuple_(*before))
+    else:
+        query = query.offset(skip)
     return (
-        db.query(db_models.UserJourney)
-        .filter(db_models.UserJourney.user_id == user_id)
-        .offset(skip)
+        query.order_by(journey.created_at.desc(), journey.id.desc())
         .limit(limit)
         .all()
     )
 
 
-def get_user_saved_journeys(db: Session, user_id: str) -> List[db_models.UserJourney]:
+def get_user_saved_journeys(
+    db: Session, user_id: str, strict: bool = False
+) -> List[db_models.UserJourney]:
     """Get user's saved journeys (up to 10)."""
     return (
         db.query(db_models.UserJourney)
+        .options(*([raiseload("*")] if strict else []))
         .filter(
             db_models.UserJourney.user_id == user_id,
             db_models.UserJourney.is_saved.is_(True),
@@ -52,11 +133,12 @@ def get_user_saved_journeys(db: Session, user_id: str) -> List[db_models.UserJou
 
 
 def get_user_active_journey(
-    db: Session, user_id: str
+    db: Session, user_id: str, strict: bool = False
 ) -> Optional[db_models.UserJourney]:
     """Get user's currently active journey."""
     return (
         db.query(db_models.UserJourney)
+        .options(*([raiseload("*")] if strict else []))
         .filter(
             db_models.UserJourney.user_id == user_id,
             db_models.UserJourney.is_active.is_(True),
@@ -90,3 +172,127 @@ def delete_user_journey(db: Session, journey_id: str) -> bool:
     db.delete(db_user_journey)
     db.commit()
     return True
+
+
+def update_user_journey_for_user(
+    db: Session, journey_id: str, user_id: str, journey_update: UserJourneyUpdate
+) -> Optional[db_models.UserJourney]:
+    """
+    Update a journey owned by the user with one UPDATE ... RETURNING.
+
+    Returns None if the journey does not exist or belongs to another user.
+    """
+    update_data = journey_update.model_dump(exclude_unset=True)
+    update_data["updated_at"] = datetime.now()
+
+    db_user_journey = db.scalars(
+        update(db_models.UserJourney)
+        .where(
+            db_models.UserJourney.id == journey_id,
+            db_models.UserJourney.user_id == user_id,
+        )
+        .values(**update_data)
+        .returning(db_models.UserJourney)
+        .execution_options(synchronize_session=False)
+    ).one_or_none()
+    if db_user_journey is not None:
+        db.expunge(db_user_journey)
+    db.commit()
+    return db_user_journey
+
+
+def _set_user_journey_progress_for_user(
+    db: Session, journey_id: str, user_id: str, in_progress: bool, **values
+) -> Optional[db_models.UserJourney]:
+    """
+    Flip is_in_progress on an owned journey with one UPDATE ... RETURNING.
+
+    The update only applies if the journey is currently in the opposite
+    state, so concurrent start/end calls cannot both succeed.
+    """
+    db_user_journey = db.scalars(
+        update(db_models.UserJourney)
+        .where(
+            db_models.UserJourney.id == journey_id,
+            db_models.UserJourney.user_id == user_id,
+            db_models.UserJourney.is_in_progress.is_not(in_progress),
+        )
+        .values(is_in_progress=in_progress, **values)
+        .returning(db_models.UserJourney)
+        .execution_options(synchronize_session=False)
+    ).one_or_none()
+    if db_user_journey is not None:
+        db.expunge(db_user_journey)
+    db.commit()
+    return db_user_journey
+
+
+def start_user_journey_for_user(
+    db: Session, journey_id: str, user_id: str, started_at: datetime
+) -> Optional[db_models.UserJourney]:
+    """Mark an owned journey as started. None if missing or already running."""
+    return _set_user_journey_progress_for_user(
+        db,
+        journey_id,
+        user_id,
+        True,
+        started_at=started_at,
+        current_stop_index=0,
+        ended_at=None,
+    )
+
+
+def end_user_journey_for_user(
+    db: Session, journey_id: str, user_id: str, ended_at: datetime
+) -> Optional[db_models.UserJourney]:
+    """Mark an owned journey as ended. None if missing or not running."""
+    return _set_user_journey_progress_for_user(
+        db, journey_id, user_id, False, ended_at=ended_at
+    )
+
+
+def user_journey_has_feedback(db: Session, journey_id: str) -> bool:
+    """Whether any feedback was left for the journey."""
+    return db.query(
+        db.query(db_models.Feedback.id)
+        .filter(db_models.Feedback.user_journey_id == journey_id)
+        .exists()
+    ).scalar()
+
+
+def delete_user_journey_for_user(db: Session, journey_id: str, user_id: str) -> bool:
+    """
+    Delete a journey owned by the user, together with its stops.
+
+    Sensor readings recorded on the journey are kept and detached from it, as
+    the ORM delete did. Callers must refuse journeys that have feedback
+    (feedbacks.user_journey_id is NOT NULL).
+
+    Returns False if the journey does not exist or belongs to another user.
+    """
+    owned_journey = db.query(db_models.UserJourney.id).filter(
+        db_models.UserJourney.id == journey_id,
+        db_models.UserJourney.user_id == user_id,
+    )
+    db.execute(
+        update(db_models.JourneyData)
+        .where(db_models.JourneyData.user_journey_id.in_(owned_journey))
+        .values(user_journey_id=None)
+        .execution_options(synchronize_session=False)
+    )
+    db.execute(
+        delete(db_models.UserJourneyStop)
+        .where(db_models.UserJourneyStop.user_journey_id.in_(owned_journey))
+        .execution_options(synchronize_session=False)
+    )
+    deleted_id = db.execute(
+        delete(db_models.UserJourney)
+        .where(
+            db_models.UserJourney.id == journey_id,
+            db_models.UserJourney.user_id == user_id,
+        )
+        .returning(db_models.UserJourney.id)
+        .execution_options(synchronize_session=False)
+    ).scalar_one_or_none()
+    db.commit()
+    return deleted_id is not None
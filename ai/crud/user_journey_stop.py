@@ -2,6 +2,7 @@ from typing import List, Optional
 
 import db_models
 from models import UserJourneyStopCreate, UserJourneyStopUpdate
+from sqlalchemy import delete, select, update
 from sqlalchemy.orm import Session
 
 
@@ -39,6 +40,16 @@ def get_user_journey_stops(
     )
 
 
+def get_user_journey_stop_ids(db: Session, user_journey_id: str) -> List[str]:
+    """Get only the stop IDs of a user journey, ordered by stop_order."""
+    return [
+        str(stop_id)
+        for (stop_id,) in db.query(db_models.UserJourneyStop.stop_id)
+        .filter(db_models.UserJourneyStop.user_journey_id == user_journey_id)
+        .order_by(db_models.UserJourneyStop.stop_order)
+    ]
+
+
 def update_user_journey_stop(
     db: Session, stop_id: str, stop_update: UserJourneyStopUpdate
 ) -> Optional[db_models.UserJourneyStop]:
@@ -55,6 +66,39 @@ def update_user_journey_stop(
     return db_stop
 
 
+def update_user_journey_stop_for_user(
+    db: Session, stop_id: str, user_id: str, stop_update: UserJourneyStopUpdate
+) -> Optional[db_models.UserJourneyStop]:
+    """
+    Update a stop whose journey is owned by the user, in one statement.
+
+    Returns None if the stop does not exist or belongs to another user.
+    """
+    update_data = stop_update.model_dump(exclude_unset=True)
+    owned_journeys = select(db_models.UserJourney.id).where(
+        db_models.UserJourney.user_id == user_id
+    )
+    stmt = update(db_models.UserJourneyStop).where(
+        db_models.UserJourneyStop.id == stop_id,
+        db_models.UserJourneyStop.user_journey_id.in_(owned_journeys),
+    )
+    if update_data:
+        stmt = stmt.values(**update_data)
+    else:
+        # Nothing to change: a no-op SET still checks ownership and returns the row
+        stmt = stmt.values(stop_order=db_models.UserJourneyStop.stop_order)
+
+    db_stop = db.scalars(
+        stmt.returning(db_models.UserJourneyStop).execution_options(
+            synchronize_session=False
+        )
+    ).one_or_none()
+    if db_stop is not None:
+        db.expunge(db_stop)
+    db.commit()
+    return db_stop
+
+
 def delete_user_journey_stop(db: Session, stop_id: str) -> bool:
     db_stop = get_user_journey_stop(db, stop_id)
     if not db_stop:
@@ -64,12 +108,70 @@ def delete_user_journey_stop(db: Session, stop_id: str) -> bool:
     return True
 
 
+def delete_user_journey_stop_for_user(db: Session, stop_id: str, user_id: str) -> bool:
+    """
+    Delete a stop whose journey is owned by the user, in one statement.
+
+    Returns False if the stop does not exist or belongs to another user.
+    """
+    deleted_id = db.execute(
+        delete(db_models.UserJourneyStop)
+        .where(
+            db_models.UserJourneyStop.id == stop_id,
+            db_models.UserJourneyStop.user_journey_id.in_(
+                select(db_models.UserJourney.id).where(
+                    db_models.UserJourney.user_id == user_id
+                )
+            ),
+        )
+        .returning(db_models.UserJourneyStop.id)
+        .execution_options(synchronize_session=False)
+    ).scalar_one_or_none()
+    db.commit()
+    return deleted_id is not None
+
+
+def delete_user_journey_stops_for_user(
+    db: Session, stop_ids: List[str], user_id: str
+) -> bool:
+    """
+    Delete several stops in one statement if all belong to the user's journeys.
+
+    Nothing is deleted (and False is returned) when any stop is missing or
+    owned by another user.
+    """
+    stop_ids = list(set(stop_ids))
+    deleted_ids = (
+        db.execute(
+            delete(db_models.UserJourneyStop)
+            .where(
+                db_models.UserJourneyStop.id.in_(stop_ids),
+                db_models.UserJourneyStop.user_journey_id.in_(
+                    select(db_models.UserJourney.id).where(
+                        db_models.UserJourney.user_id == user_id
+                    )
+                ),
+            )
+            .returning(db_models.UserJourneyStop.id)
+            .execution_options(synchronize_session=False)
+        )
+        .scalars()
+        .all()
+    )
+    if len(deleted_ids) != len(stop_ids):
+        db.rollback()
+        return False
+    db.commit()
+    return True
+
+
 def delete_all_user_journey_stops(db: Session, user_journey_id: str) -> int:
     """Delete all stops for a user journey. Returns number of deleted stops."""
+    # One bulk DELETE; loaded stops need no in-session bookkeeping
     result = (
         db.query(db_models.UserJourneyStop)
         .filter(db_models.UserJourneyStop.user_journey_id == user_journey_id)
-        .delete()
+        .delete(synchronize_session=False)
     )
     db.commit()
     return result
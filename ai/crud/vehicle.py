@@ -3,7 +3,7 @@ from typing import List, Optional
 
 import db_models
 from models import VehicleCreate, VehicleUpdate
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 
 
 def create_vehicle(db: Session, vehicle: VehicleCreate) -> db_models.Vehicle:
@@ -14,16 +14,29 @@ def create_vehicle(db: Session, vehicle: VehicleCreate) -> db_models.Vehicle:
     return db_vehicle
 
 
-def get_vehicle(db: Session, vehicle_id: str) -> Optional[db_models.Vehicle]:
+def get_vehicle(
+    db: Session, vehicle_id: str, strict: bool = False
+) -> Optional[db_models.Vehicle]:
+    """Get a vehicle; with ``strict``, lazy-loading its relationships raises."""
     return (
-        db.query(db_models.Vehicle).filter(db_models.Vehicle.id == vehicle_id).first()
+        db.query(db_models.Vehicle)
+        .options(*([raiseload("*")] if strict else []))
+        .filter(db_models.Vehicle.id == vehicle_id)
+        .first()
     )
 
 
 def get_vehicles(
-    db: Session, skip: int = 0, limit: int = 100
+    db: Session, skip: int = 0, limit: int = 100, strict: bool = False
 ) -> List[db_models.Vehicle]:
-    return db.query(db_models.Vehicle).offset(skip).limit(limit).all()
+    """Get vehicles; with ``strict``, lazy-loading their relationships raises."""
+    return (
+        db.query(db_models.Vehicle)
+        .options(*([raiseload("*")] if strict else []))
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
 
 
 def update_vehicle(
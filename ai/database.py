@@ -1,10 +1,30 @@
-from sqlalchemy import create_engine
+from config import settings
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
-DATABASE_URL = "sqlite:///./transportation.db"
+DATABASE_URL = settings.DATABASE_URL
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+# SQLite connections are shared across FastAPI's worker threads
+connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
+
+# By default the handler threadpool (THREADPOOL_SIZE) is no larger than
+# DB_POOL_SIZE + DB_MAX_OVERFLOW, so a sync handler never waits on a connection.
+# If the pool is exhausted anyway, checkout fails after DB_POOL_TIMEOUT seconds.
+# Pre-ping and recycle drop connections the server has closed. LIFO checkout
+# keeps reusing warm connections and lets surplus ones go idle. The statement
+# cache is sized to hold every hot statement without recompiling.
+engine = create_engine(
+    DATABASE_URL,
+    connect_args=connect_args,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_use_lifo=True,
+    query_cache_size=1200,
+)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -19,9 +39,79 @@ def get_db():
         db.close()
 
 
+def warm_up_pool(connections: int = 5):
+    """Open a few pooled connections up front so first requests skip connecting."""
+    opened = []
+    try:
+        for _ in range(min(connections, settings.DB_POOL_SIZE)):
+            conn = engine.connect()
+            conn.execute(text("SELECT 1"))
+            opened.append(conn)
+    finally:
+        for conn in opened:
+            conn.close()
+
+
+def _ensure_report_verification_unique_index():
+    """
+    Add the one-verification-per-user-per-report index to older databases.
+
+    create_all() never alters existing tables, but verify_report's
+    ON CONFLICT (report_id, user_id) needs a matching unique index. Duplicate
+    verifications (one per pair is kept) are removed before it is created.
+    """
+    columns = ["report_id", "user_id"]
+    inspector = inspect(engine)
+    unique_column_sets = [
+        c["column_names"]
+        for c in inspector.get_unique_constraints("report_verifications")
+    ] + [
+        i["column_names"]
+        for i in inspector.get_indexes("report_verifications")
+        if i["unique"]
+    ]
+    if columns in unique_column_sets:
+        return
+
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "DELETE FROM report_verifications WHERE id NOT IN ("
+                "SELECT MIN(id) FROM report_verifications "
+                "GROUP BY report_id, user_id)"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE UNIQUE INDEX IF NOT EXISTS "
+                "uq_report_verifications_report_user "
+                "ON report_verifications (report_id, user_id)"
+            )
+        )
+
+
+def _ensure_route_segment_shape_points_json_column():
+    """
+    Add the precomputed shape_points_json column to older route_segments tables.
+
+    create_all() never alters existing tables; the column starts out NULL and
+    crud.shape_point builds the JSON from shape_points until it is refreshed.
+    """
+    columns = [c["name"] for c in inspect(engine).get_columns("route_segments")]
+    if "shape_points_json" in columns:
+        return
+
+    with engine.begin() as conn:
+        conn.execute(
+            text("ALTER TABLE route_segments ADD COLUMN shape_points_json TEXT")
+        )
+
+
 def init_db():
     """Create all tables."""
     Base.metadata.create_all(bind=engine)
+    _ensure_report_verification_unique_index()
+    _ensure_route_segment_shape_points_json_column()
 
 
 def init_db_with_data():
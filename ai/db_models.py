@@ -2,8 +2,19 @@ from datetime import datetime
 from uuid import uuid4
 
 from database import Base
-from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Integer, String
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
+from sqlalchemy.orm import deferred, relationship
 
 
 def generate_uuid():
@@ -85,6 +96,13 @@ class Route(Base):
 
 class RouteStop(Base):
     __tablename__ = "route_stops"
+    __table_args__ = (
+        Index(
+            "ix_route_stops_route_id_scheduled_arrival",
+            "route_id",
+            "scheduled_arrival",
+        ),
+    )
 
     id = Column(String, primary_key=True, default=generate_uuid)
     route_id = Column(String, ForeignKey("routes.id"), nullable=False)
@@ -203,6 +221,11 @@ class JourneyData(Base):
 
 class Report(Base):
     __tablename__ = "reports"
+    __table_args__ = (
+        Index("ix_reports_vehicle_id_created_at", "vehicle_id", "created_at"),
+        Index("ix_reports_category_created_at", "category", "created_at"),
+        Index("ix_reports_vehicle_trip_id", "vehicle_trip_id"),
+    )
 
     id = Column(String, primary_key=True, default=generate_uuid)
     vehicle_trip_id = Column(String, ForeignKey("vehicle_trips.id"), nullable=False)
@@ -229,6 +252,7 @@ class Report(Base):
 
 class Ticket(Base):
     __tablename__ = "tickets"
+    __table_args__ = (Index("ix_tickets_user_id_valid_to", "user_id", "valid_to"),)
 
     id = Column(String, primary_key=True, default=generate_uuid)
     user_id = Column(String, ForeignKey("users.id"), nullable=False)
@@ -244,6 +268,10 @@ class Ticket(Base):
 
 class UserJourney(Base):
     __tablename__ = "user_journeys"
+    __table_args__ = (
+        Index("ix_user_journeys_user_id_created_at", "user_id", "created_at"),
+        Index("ix_user_journeys_user_id_is_in_progress", "user_id", "is_in_progress"),
+    )
 
     id = Column(String, primary_key=True, default=generate_uuid)
     user_id = Column(String, ForeignKey("users.id"), nullable=False)
@@ -261,13 +289,24 @@ class UserJourney(Base):
     updated_at = Column(DateTime, nullable=True)
 
     user = relationship("User", back_populates="user_journeys")
-    stops = relationship("UserJourneyStop", back_populates="user_journey")
+    stops = relationship(
+        "UserJourneyStop",
+        back_populates="user_journey",
+        order_by="UserJourneyStop.stop_order",
+    )
     journey_data = relationship("JourneyData", back_populates="user_journey")
     feedbacks = relationship("Feedback", back_populates="user_journey")
 
 
 class UserJourneyStop(Base):
     __tablename__ = "user_journey_stops"
+    __table_args__ = (
+        Index(
+            "ix_user_journey_stops_user_journey_id_stop_order",
+            "user_journey_id",
+            "stop_order",
+        ),
+    )
 
     id = Column(String, primary_key=True, default=generate_uuid)
     user_journey_id = Column(String, ForeignKey("user_journeys.id"), nullable=False)
@@ -281,11 +320,20 @@ class UserJourneyStop(Base):
 
 class RouteSegment(Base):
     __tablename__ = "route_segments"
+    __table_args__ = (
+        Index(
+            "ix_route_segments_from_stop_id_to_stop_id", "from_stop_id", "to_stop_id"
+        ),
+    )
 
     id = Column(String, primary_key=True, default=generate_uuid)
     from_stop_id = Column(String, ForeignKey("stops.id"), nullable=False)
     to_stop_id = Column(String, ForeignKey("stops.id"), nullable=False)
     shape_id = Column(String, nullable=False, unique=True, index=True)
+    # Precomputed JSON array of this segment's shape points, kept in sync by
+    # crud.shape_point (built from shape_points on read while NULL). Deferred
+    # so segment queries don't pull the whole array unless it is asked for.
+    shape_points_json = deferred(Column(Text, nullable=True))
     created_at = Column(DateTime, default=datetime.now)
 
     from_stop = relationship("Stop", foreign_keys=[from_stop_id])
@@ -295,6 +343,9 @@ class RouteSegment(Base):
 
 class ShapePoint(Base):
     __tablename__ = "shape_points"
+    __table_args__ = (
+        Index("ix_shape_points_shape_id_sequence", "shape_id", "shape_pt_sequence"),
+    )
 
     id = Column(String, primary_key=True, default=generate_uuid)
     shape_id = Column(
@@ -337,6 +388,12 @@ class Feedback(Base):
 
 class ReportVerification(Base):
     __tablename__ = "report_verifications"
+    __table_args__ = (
+        # One verification per user per report
+        UniqueConstraint(
+            "report_id", "user_id", name="uq_report_verifications_report_user"
+        ),
+    )
 
     id = Column(String, primary_key=True, default=generate_uuid)
     report_id = Column(String, ForeignKey("reports.id"), nullable=False)
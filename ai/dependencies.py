@@ -2,19 +2,46 @@
 Authentication dependencies for FastAPI routes.
 """
 
-from typing import Optional
+from typing import NamedTuple, Optional
 
 import crud
+import orjson
 from auth import decode_access_token
 from database import get_db
 from enums import UserRole
 from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from services import cache_service
 from sqlalchemy.orm import Session
 
 security = HTTPBearer()
 
 
+class CurrentUser(NamedTuple):
+    """
+    Identity fields handlers read from current_user.
+
+    Only non-PII scalars are kept, since they are cached; anything else is
+    loaded explicitly (e.g. /users/me fetches the full profile).
+    """
+
+    id: str
+    role: str
+    is_disabled: bool
+
+
+CURRENT_USER_CACHE_TTL_SECONDS = 60
+
+
+def _current_user_cache_key(user_id: str) -> str:
+    return f"auth:identity:{user_id}"
+
+
+def invalidate_current_user_cache(user_id: str) -> None:
+    """Drop the cached identity of a user after their profile changes."""
+    cache_service.cache_delete(_current_user_cache_key(user_id))
+
+
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db),
@@ -22,6 +49,10 @@ def get_current_user(
     """
     Get current user from JWT token in Authorization header.
     Expects: Authorization: Bearer <token>
+
+    Returns the user's identity fields (CurrentUser). Active users are
+    cached briefly by id, so repeated requests skip the users table lookup;
+    the token itself is still verified on every request.
     """
     token = credentials.credentials
 
@@ -43,6 +74,10 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    cached = cache_service.cache_get(_current_user_cache_key(user_id))
+    if cached is not None:
+        return CurrentUser(**orjson.loads(cached))
+
     # Get user from database
     user = crud.get_user(db, user_id)
     if not user:
@@ -57,7 +92,15 @@ def get_current_user(
             detail="Account has been deactivated",
         )
 
-    return user
+    identity = CurrentUser(
+        id=user.id, role=user.role, is_disabled=bool(user.is_disabled)
+    )
+    cache_service.cache_set(
+        _current_user_cache_key(user_id),
+        orjson.dumps(identity._asdict()),
+        CURRENT_USER_CACHE_TTL_SECONDS,
+    )
+    return identity
 
 
 def get_current_user_optional(
@@ -1,6 +1,10 @@
-from database import init_db_with_data
+from anyio import to_thread
+from config import settings
+from database import init_db_with_data, warm_up_pool
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from routers import (
     auth,
     delay_prediction,
@@ -20,18 +24,33 @@ from routers import (
     vehicles,
     voice_assistant,
 )
+from services import cache_service
 
 app = FastAPI(
     title="Transportation Management API",
     description="API for managing transportation routes, journeys, and sensor data",
     version="1.0.0",
+    # Encode every JSON response with orjson instead of the stdlib json module
+    default_response_class=ORJSONResponse,
 )
 
 
 @app.on_event("startup")
 def startup_event():
-    """Initialize database and system data on startup."""
+    """Initialize database, system data and shared clients on startup."""
     init_db_with_data()
+    warm_up_pool()
+    cache_service.init_redis()
+
+    # Route handlers and their CRUD calls are sync, so FastAPI runs them in
+    # AnyIO's threadpool; size it so it is not the concurrency bottleneck.
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+
+
+@app.on_event("shutdown")
+def shutdown_event():
+    """Release pooled connections held by shared clients."""
+    cache_service.close_redis()
 
 
 app.add_middleware(
@@ -40,7 +59,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # /user-journeys/my pages through this header, so browsers must see it
+    expose_headers=["X-Next-Cursor"],
 )
+# Route geometry payloads (full-route, shape points) compress very well; level 6
+# gets nearly all of level 9's ratio on JSON at a fraction of the CPU
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=6)
 
 modules = [
     auth,
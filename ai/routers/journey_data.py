@@ -8,8 +8,9 @@ from db_models import Stop
 from db_models import UserJourney as UserJourneyDB
 from db_models import UserJourneyStop as UserJourneyStopDB
 from dependencies import get_current_user, require_admin_or_dispatcher
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, status
 from models import JourneyData, JourneyDataCreate, JourneyProgressResponse
+from routers.utils import get_or_404, invalidate_my_journeys_cache
 from sqlalchemy.orm import Session
 
 router = APIRouter(prefix="/journey-data", tags=["journey-data"])
@@ -76,6 +77,7 @@ def create_journey_data(
             if new_index > current_idx:
                 user_journey.current_stop_index = new_index  # type: ignore
                 db.commit()
+                invalidate_my_journeys_cache(str(user_journey.user_id))
 
     # Get journey stops for progress calculation
     journey_stops = (
@@ -160,8 +162,10 @@ def create_journey_data(
 
             # Request feedback if not already requested
             if not feedback_requested:
+                owner_id = str(user_journey.user_id)
                 user_journey.feedback_requested = True  # type: ignore
                 db.commit()
+                invalidate_my_journeys_cache(owner_id)
                 feedback_requested = True
 
     return JourneyProgressResponse(
@@ -200,9 +204,7 @@ def get_journey_data(
     _=Depends(require_admin_or_dispatcher),
 ):
     """Get specific sensor data. Requires ADMIN or DISPATCHER role."""
-    db_journey_data = crud.get_journey_data(db, journey_data_id)
-    if not db_journey_data:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="JourneyData not found"
-        )
+    db_journey_data = get_or_404(
+        crud.get_journey_data, db, journey_data_id, "JourneyData"
+    )
     return db_journey_data
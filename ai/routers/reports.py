@@ -1,10 +1,10 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 import crud
 from crud import report_verification
 from database import get_db
-from dependencies import get_current_user, require_admin_or_dispatcher
+from dependencies import CurrentUser, get_current_user, require_admin_or_dispatcher
 from enums import ReportCategory, UserRole
 from fastapi import APIRouter, Depends, HTTPException, status
 from models import (
@@ -13,8 +13,8 @@ from models import (
     ReportUpdate,
     ReportVerificationCreate,
     ReportVerificationStatus,
-    User,
 )
+from routers.utils import get_or_404
 from sqlalchemy.orm import Session
 
 router = APIRouter(prefix="/reports", tags=["reports"])
@@ -23,7 +23,7 @@ router = APIRouter(prefix="/reports", tags=["reports"])
 @router.post("/", response_model=Report, status_code=status.HTTP_201_CREATED)
 def create_report(
     report: ReportCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
@@ -47,8 +47,9 @@ def create_report(
     if report.category in critical_categories:
         # TODO: Implement algorithm to find alternative faster route
         # In production, this would trigger a notification service
+        user_name = crud.get_user(db, str(current_user.id)).name
         print(
-            f"[NOTIFICATION] Finding alternative route for user {current_user.name} due to {report.category.value}"
+            f"[NOTIFICATION] Finding alternative route for user {user_name} due to {report.category.value}"
         )
 
     return created_report
@@ -58,11 +59,16 @@ def create_report(
 def get_all_reports(
     skip: int = 0,
     limit: int = 100,
+    after: Optional[str] = None,
     db: Session = Depends(get_db),
     _=Depends(require_admin_or_dispatcher),
 ):
-    """Get all reports. Requires ADMIN or DISPATCHER role."""
-    return crud.get_reports(db, skip=skip, limit=limit)
+    """
+    Get all reports. Requires ADMIN or DISPATCHER role.
+
+    Pass the last report id as `after` to fetch the next page.
+    """
+    return crud.get_reports(db, skip=skip, limit=limit, after=after)
 
 
 @router.get("/journey/{journey_id}", response_model=List[Report])
@@ -92,11 +98,7 @@ def get_reports_by_category(
 @router.get("/{report_id}", response_model=Report)
 def get_report(report_id: str, db: Session = Depends(get_db)):
     """Get a specific report. Public endpoint."""
-    db_report = crud.get_report(db, report_id)
-    if not db_report:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Report not found"
-        )
+    db_report = get_or_404(crud.get_report, db, report_id, "Report")
     return db_report
 
 
@@ -104,18 +106,14 @@ def get_report(report_id: str, db: Session = Depends(get_db)):
 def update_report(
     report_id: str,
     report_update: ReportUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
     Update a report. Requires authentication.
     Only report owner, ADMIN, or DISPATCHER can edit.
     """
-    db_report = crud.get_report(db, report_id)
-    if not db_report:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Report not found"
-        )
+    db_report = get_or_404(crud.get_report, db, report_id, "Report")
 
     # Check authorization: owner, admin, or dispatcher
     is_owner = str(db_report.user_id) == str(current_user.id)
@@ -152,18 +150,14 @@ def resolve_report(
 @router.delete("/{report_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_report(
     report_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
     Delete a report. Requires authentication.
     Only report owner or ADMIN can delete.
     """
-    db_report = crud.get_report(db, report_id)
-    if not db_report:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Report not found"
-        )
+    db_report = get_or_404(crud.get_report, db, report_id, "Report")
 
     # Check authorization: owner or admin
     is_owner = str(db_report.user_id) == str(current_user.id)
@@ -186,7 +180,7 @@ def delete_report(
 def verify_report(
     report_id: str,
     verification: ReportVerificationCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
@@ -204,11 +198,7 @@ def verify_report(
     Awards 10 reputation points to report author upon verification.
     """
     # Get report
-    db_report = crud.get_report(db, report_id)
-    if not db_report:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Report not found"
-        )
+    db_report = get_or_404(crud.get_report, db, report_id, "Report")
 
     # Check if already verified
     if bool(db_report.is_verified):
@@ -224,16 +214,6 @@ def verify_report(
             detail="You cannot verify your own report",
         )
 
-    # Check if user already verified this report
-    existing_verification = report_verification.get_user_verification(
-        db, report_id, str(current_user.id)
-    )
-    if existing_verification:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="You have already verified this report",
-        )
-
     # Check if user is on the same vehicle
     users_on_vehicle = report_verification.get_users_on_vehicle_trip(
         db, str(db_report.vehicle_trip_id), time_window_minutes=30
@@ -248,10 +228,15 @@ def verify_report(
             detail="You must be on the same vehicle to verify this report",
         )
 
-    # Create verification entry
-    report_verification.create_report_verification(
+    # Create verification entry (rejected by the DB if user already verified)
+    verification_id = report_verification.create_report_verification(
         db, report_id, str(current_user.id), verification.verified
     )
+    if verification_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="You have already verified this report",
+        )
 
     # Check if report should be verified now
     report_verification.verify_report_if_requirements_met(db, report_id)
@@ -264,7 +249,7 @@ def verify_report(
 def get_report_verification_status(
     report_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """
     Get current verification status of a report.
@@ -277,11 +262,7 @@ def get_report_verification_status(
     - Whether current user can verify
     """
     # Get report
-    db_report = crud.get_report(db, report_id)
-    if not db_report:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Report not found"
-        )
+    db_report = get_or_404(crud.get_report, db, report_id, "Report")
 
     # Get verification requirements
     requirements = report_verification.check_verification_requirements(db, report_id)
@@ -4,6 +4,7 @@ import crud
 from database import get_db
 from fastapi import APIRouter, Depends, HTTPException, status
 from models import RouteSegment
+from routers.utils import get_or_404
 from sqlalchemy.orm import Session
 
 router = APIRouter(prefix="/route-segments", tags=["route-segments"])
@@ -33,20 +34,14 @@ def get_route_segment_by_stops(
 @router.get("/by-shape/{shape_id}", response_model=RouteSegment)
 def get_route_segment_by_shape_id(shape_id: str, db: Session = Depends(get_db)):
     """Get route segment by its shape_id."""
-    db_segment = crud.get_route_segment_by_shape_id(db, shape_id)
-    if not db_segment:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Route segment not found"
-        )
+    db_segment = get_or_404(
+        crud.get_route_segment_by_shape_id, db, shape_id, "Route segment"
+    )
     return db_segment
 
 
 @router.get("/{segment_id}", response_model=RouteSegment)
 def get_route_segment(segment_id: str, db: Session = Depends(get_db)):
     """Get route segment by ID."""
-    db_segment = crud.get_route_segment(db, segment_id)
-    if not db_segment:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Route segment not found"
-        )
+    db_segment = get_or_404(crud.get_route_segment, db, segment_id, "Route segment")
     return db_segment
@@ -1,10 +1,11 @@
-from typing import List
+from typing import List, Optional
 
 import crud
 from database import get_db
 from dependencies import require_admin, require_admin_or_dispatcher
 from fastapi import APIRouter, Depends, HTTPException, status
 from models import Route, RouteCreate, RouteUpdate
+from routers.utils import get_or_404
 from sqlalchemy.orm import Session
 
 router = APIRouter(prefix="/routes", tags=["routes"])
@@ -21,17 +22,19 @@ def create_route(
 
 
 @router.get("/", response_model=List[Route])
-def get_all_routes(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return crud.get_routes(db, skip=skip, limit=limit)
+def get_all_routes(
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    """Pass the last route id as `after` to fetch the next page."""
+    return crud.get_routes(db, skip=skip, limit=limit, after=after)
 
 
 @router.get("/{route_id}", response_model=Route)
 def get_route(route_id: str, db: Session = Depends(get_db)):
-    db_route = crud.get_route(db, route_id)
-    if not db_route:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Route not found"
-        )
+    db_route = get_or_404(crud.get_route, db, route_id, "Route")
     return db_route
 
 
@@ -1,9 +1,10 @@
-from typing import List
+from typing import List, Optional
 
 import crud
 from database import get_db
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from models import ShapePoint
+from routers.utils import get_or_404
 from sqlalchemy.orm import Session
 
 router = APIRouter(prefix="/shape-points", tags=["shape-points"])
@@ -11,9 +12,13 @@ router = APIRouter(prefix="/shape-points", tags=["shape-points"])
 
 @router.get("/", response_model=List[ShapePoint])
 def get_all_shape_points(
-    skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[str] = None,
+    db: Session = Depends(get_db),
 ):
-    return crud.get_shape_points(db, skip=skip, limit=limit)
+    """Pass the last shape point id as `after` to fetch the next page."""
+    return crud.get_shape_points(db, skip=skip, limit=limit, after=after)
 
 
 @router.get("/by-shape/{shape_id}", response_model=List[ShapePoint])
@@ -21,25 +26,20 @@ def get_shape_points_by_shape_id(shape_id: str, db: Session = Depends(get_db)):
     """
     Get all GPS points for a specific route segment, ordered by sequence.
     This returns the detailed path between two stops.
+
+    Served from the segment's precomputed shape_points_json column when set.
     """
-    points = crud.get_shape_points_by_shape_id(db, shape_id)
-    if not points:
-        # Check if shape_id exists
-        segment = crud.get_route_segment_by_shape_id(db, shape_id)
-        if not segment:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Route segment with shape_id '{shape_id}' not found",
-            )
-    return points
+    points_json = crud.get_shape_points_json(db, shape_id)
+    if points_json is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Route segment with shape_id '{shape_id}' not found",
+        )
+    return Response(content=points_json, media_type="application/json")
 
 
 @router.get("/{point_id}", response_model=ShapePoint)
 def get_shape_point(point_id: str, db: Session = Depends(get_db)):
     """Get a single GPS point by ID."""
-    db_point = crud.get_shape_point(db, point_id)
-    if not db_point:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Shape point not found"
-        )
+    db_point = get_or_404(crud.get_shape_point, db, point_id, "Shape point")
     return db_point
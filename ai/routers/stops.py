@@ -1,10 +1,11 @@
-from typing import List
+from typing import List, Optional
 
 import crud
 from database import get_db
 from dependencies import require_admin, require_admin_or_dispatcher
 from fastapi import APIRouter, Depends, HTTPException, status
 from models import Stop, StopCreate, StopUpdate
+from routers.utils import get_or_404
 from sqlalchemy.orm import Session
 
 router = APIRouter(prefix="/stops", tags=["stops"])
@@ -21,17 +22,19 @@ def create_stop(
 
 
 @router.get("/", response_model=List[Stop])
-def get_all_stops(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return crud.get_stops(db, skip=skip, limit=limit)
+def get_all_stops(
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    """Pass the last stop id as `after` to fetch the next page."""
+    return crud.get_stops(db, skip=skip, limit=limit, after=after)
 
 
 @router.get("/{stop_id}", response_model=Stop)
 def get_stop(stop_id: str, db: Session = Depends(get_db)):
-    db_stop = crud.get_stop(db, stop_id)
-    if not db_stop:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Stop not found"
-        )
+    db_stop = get_or_404(crud.get_stop, db, stop_id, "Stop")
     return db_stop
 
 
@@ -5,6 +5,7 @@ from database import get_db
 from dependencies import get_current_user
 from fastapi import APIRouter, Depends, HTTPException, status
 from models import Ticket, TicketCreate, TicketUpdate
+from routers.utils import get_or_404
 from sqlalchemy.orm import Session
 
 router = APIRouter(prefix="/tickets", tags=["tickets"])
@@ -31,9 +32,7 @@ def get_my_tickets(
     current_user=Depends(get_current_user),
 ):
     """Get all tickets for the authenticated user."""
-    all_tickets = crud.get_tickets(db, skip=0, limit=1000)
-    user_tickets = [t for t in all_tickets if str(t.user_id) == str(current_user.id)]
-    return user_tickets[skip : skip + limit]
+    return crud.get_user_tickets(db, str(current_user.id), skip=skip, limit=limit)
 
 
 @router.get("/my/active", response_model=List[Ticket])
@@ -41,17 +40,7 @@ def get_my_active_tickets(
     db: Session = Depends(get_db), current_user=Depends(get_current_user)
 ):
     """Get active (valid) tickets for the authenticated user."""
-    from datetime import datetime
-
-    all_tickets = crud.get_tickets(db, skip=0, limit=1000)
-    user_tickets = [t for t in all_tickets if str(t.user_id) == str(current_user.id)]
-
-    now = datetime.now()
-    active_tickets = [
-        t for t in user_tickets if t.valid_from <= now and t.valid_until >= now  # type: ignore
-    ]
-
-    return active_tickets
+    return crud.get_active_user_tickets(db, str(current_user.id))
 
 
 @router.get("/{ticket_id}", response_model=Ticket)
@@ -64,11 +53,7 @@ def get_ticket(
     Get a specific ticket by ID.
     User can only view their own tickets.
     """
-    db_ticket = crud.get_ticket(db, ticket_id)
-    if not db_ticket:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Ticket not found"
-        )
+    db_ticket = get_or_404(crud.get_ticket, db, ticket_id, "Ticket")
 
     if str(db_ticket.user_id) != str(current_user.id):
         raise HTTPException(
@@ -90,11 +75,7 @@ def update_ticket(
     Update a ticket.
     User can only update their own tickets.
     """
-    db_ticket = crud.get_ticket(db, ticket_id)
-    if not db_ticket:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Ticket not found"
-        )
+    db_ticket = get_or_404(crud.get_ticket, db, ticket_id, "Ticket")
 
     if str(db_ticket.user_id) != str(current_user.id):
         raise HTTPException(
@@ -120,11 +101,7 @@ def delete_ticket(
     Delete a ticket.
     User can only delete their own tickets.
     """
-    db_ticket = crud.get_ticket(db, ticket_id)
-    if not db_ticket:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Ticket not found"
-        )
+    db_ticket = get_or_404(crud.get_ticket, db, ticket_id, "Ticket")
 
     if str(db_ticket.user_id) != str(current_user.id):
         raise HTTPException(
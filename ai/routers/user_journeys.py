@@ -1,17 +1,29 @@
-from datetime import date, datetime, timedelta
-from hashlib import md5
-from typing import List
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from hashlib import sha256
+from types import MappingProxyType
+from typing import List, Optional
 from uuid import UUID
 
 import crud
 import googlemaps
+import orjson
 from config import settings
 from crud import journey_tracking
 from database import get_db
 from db_models import UserJourney as UserJourneyDB
-from db_models import UserJourneyStop as UserJourneyStopDB
 from dependencies import get_current_user
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
 from models import (
     FullRouteResponse,
     RouteProposal,
@@ -26,10 +38,105 @@ from models import (
     UserJourneyStopUpdate,
     UserJourneyUpdate,
 )
+from pydantic import TypeAdapter
+from requests.adapters import HTTPAdapter
+from routers.utils import (
+    active_journey_cache_key,
+    cached_json_response,
+    etag_matches,
+    full_route_response,
+    full_route_segment_rows,
+    invalidate_my_journeys_cache,
+    orm_json_response,
+    saved_journeys_cache_key,
+    weak_etag,
+)
+from services import cache_service
 from sqlalchemy.orm import Session
 
 router = APIRouter(prefix="/user-journeys", tags=["user-journeys"])
 
+# Google Maps vehicle type -> (GTFS route_type, mode), read-only
+GOOGLE_TO_GTFS = MappingProxyType(
+    {
+        "BUS": (3, "bus"),
+        "TRAM": (0, "tram"),
+        "LIGHT_RAIL": (0, "tram"),
+        "HEAVY_RAIL": (2, "train"),
+        "COMMUTER_TRAIN": (2, "train"),
+        "SUBWAY": (2, "train"),
+        "RAIL": (2, "train"),
+    }
+)
+WALK_GTFS = (None, "walk")
+UNKNOWN_GTFS = (None, "unknown")
+
+# Transit timetables are static on this scale, so Directions results are reused
+DIRECTIONS_CACHE_TTL_SECONDS = 600
+
+# Whole proposal responses are kept shorter, since they depend on "now"-ish
+# departure times that users tend to repeat only within a couple of minutes
+PROPOSALS_CACHE_TTL_SECONDS = 120
+
+# /my/active and /my/saved are polled by clients but change only on writes,
+# which invalidate them; the TTL bounds staleness from any missed write
+MY_JOURNEYS_CACHE_TTL_SECONDS = 15
+# A journey's owner never changes, so the lookup is only dropped on delete
+JOURNEY_OWNER_CACHE_TTL_SECONDS = 300
+_ACTIVE_JOURNEY_ADAPTER = TypeAdapter(Optional[UserJourney])
+_SAVED_JOURNEYS_ADAPTER = TypeAdapter(List[UserJourney])
+
+
+def _journey_owner_cache_key(journey_id: str) -> str:
+    return f"user-journeys:owner:{journey_id}"
+
+
+def _check_own_journey(db: Session, journey_id: str, current_user) -> None:
+    """
+    Verify the current user owns a journey without loading the journey row.
+
+    For endpoints that only need the ownership check; the owner id is cached
+    so repeated calls on the same journey skip the database.
+    """
+    key = _journey_owner_cache_key(journey_id)
+    cached = cache_service.cache_get(key)
+    if cached is not None:
+        owner_id: Optional[str] = cached.decode()
+    else:
+        owner_id = crud.get_user_journey_owner_id(db, journey_id)
+        if owner_id is not None:
+            cache_service.cache_set(
+                key, owner_id.encode(), JOURNEY_OWNER_CACHE_TTL_SECONDS
+            )
+    if owner_id != str(current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="User journey not found"
+        )
+
+
+def _get_own_journey(
+    db: Session, journey_id: str, current_user, with_stops: bool = False
+) -> UserJourneyDB:
+    """
+    Load a journey owned by the current user in a single query.
+
+    Journeys of other users yield the same 404 as missing ones. With
+    ``with_stops`` the ordered stops are preloaded alongside the journey.
+    """
+    if with_stops:
+        db_journey = crud.get_user_journey_with_stops_for_user(
+            db, journey_id, str(current_user.id), strict=settings.STRICT_LOADING
+        )
+    else:
+        db_journey = crud.get_user_journey_for_user(
+            db, journey_id, str(current_user.id)
+        )
+    if not db_journey:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="User journey not found"
+        )
+    return db_journey
+
 
 @router.post("/", response_model=UserJourney, status_code=status.HTTP_201_CREATED)
 def create_user_journey(
@@ -45,25 +152,19 @@ def create_user_journey(
     - If user is disabled and journey is scheduled for tomorrow, notifies DISPATCHER
     - Sets notification_time to 30 minutes before journey start
     """
-    # Create journey first
-    db_journey = crud.create_user_journey(db, journey, str(current_user.id))
-
-    # Set notification_time automatically if planned_date is provided
+    # Set notification_time automatically if planned_date is provided, so the
+    # journey is created with it in a single INSERT
+    notification_time = None
     if journey.planned_date:
         reminder_time = journey.planned_date - timedelta(minutes=30)
-        if reminder_time > datetime.now():
-            # Update notification_time directly in database
-            db_journey_model = (
-                db.query(UserJourneyDB)
-                .filter(UserJourneyDB.id == str(db_journey.id))
-                .first()
-            )
-            if db_journey_model:
-                db_journey_model.notification_time = reminder_time  # type: ignore
-                db.commit()
-                db.refresh(db_journey_model)
-                # Update returned model
-                db_journey.notification_time = reminder_time  # type: ignore
+        # Compare in the planned date's own timezone (naive or aware)
+        if reminder_time > datetime.now(reminder_time.tzinfo):
+            notification_time = reminder_time
+
+    db_journey = crud.create_user_journey(
+        db, journey, str(current_user.id), notification_time=notification_time
+    )
+    invalidate_my_journeys_cache(str(current_user.id))
 
     # Trigger 1: Notify DISPATCHER if disabled person schedules journey for next day
     # This is returned as part of response, not stored in database
@@ -72,8 +173,9 @@ def create_user_journey(
         if journey.planned_date.date() == tomorrow:
             # TODO: In production, send actual notification to dispatchers
             # For now, this would be handled by a separate notification service
+            user_name = crud.get_user(db, str(current_user.id)).name
             print(
-                f"[NOTIFICATION] User {current_user.name} (disabled) scheduled journey for tomorrow"
+                f"[NOTIFICATION] User {user_name} (disabled) scheduled journey for tomorrow"
             )
 
     return db_journey
@@ -83,11 +185,39 @@ def create_user_journey(
 def get_my_journeys(
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    """Get all journeys for the authenticated user."""
-    return crud.get_user_journeys(db, str(current_user.id), skip=skip, limit=limit)
+    """
+    Get all journeys for the authenticated user, newest first.
+
+    For the next page pass the X-Next-Cursor response header back as `cursor`;
+    `skip` is still honoured when no cursor is given.
+    """
+    before = None
+    if cursor:
+        created_at, _, journey_id = cursor.partition("_")
+        try:
+            before = (datetime.fromisoformat(created_at), journey_id)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            )
+
+    journeys = crud.get_user_journeys(
+        db,
+        str(current_user.id),
+        skip=skip,
+        limit=limit,
+        before=before,
+        strict=settings.STRICT_LOADING,
+    )
+    response = orm_json_response(journeys)
+    if len(journeys) == limit:
+        last = journeys[-1]
+        response.headers["X-Next-Cursor"] = f"{last.created_at.isoformat()}_{last.id}"
+    return response
 
 
 @router.get("/my/saved", response_model=List[UserJourney])
@@ -95,7 +225,15 @@ def get_my_saved_journeys(
     db: Session = Depends(get_db), current_user=Depends(get_current_user)
 ):
     """Get saved (not active) journeys for the authenticated user (max 10)."""
-    return crud.get_user_saved_journeys(db, str(current_user.id))
+    user_id = str(current_user.id)
+    return cached_json_response(
+        saved_journeys_cache_key(user_id),
+        _SAVED_JOURNEYS_ADAPTER,
+        lambda: crud.get_user_saved_journeys(
+            db, user_id, strict=settings.STRICT_LOADING
+        ),
+        MY_JOURNEYS_CACHE_TTL_SECONDS,
+    )
 
 
 @router.get("/my/active", response_model=UserJourney | None)
@@ -103,7 +241,15 @@ def get_my_active_journey(
     db: Session = Depends(get_db), current_user=Depends(get_current_user)
 ):
     """Get the active journey for the authenticated user."""
-    return crud.get_user_active_journey(db, str(current_user.id))
+    user_id = str(current_user.id)
+    return cached_json_response(
+        active_journey_cache_key(user_id),
+        _ACTIVE_JOURNEY_ADAPTER,
+        lambda: crud.get_user_active_journey(
+            db, user_id, strict=settings.STRICT_LOADING
+        ),
+        MY_JOURNEYS_CACHE_TTL_SECONDS,
+    )
 
 
 @router.get("/{journey_id}", response_model=UserJourney)
@@ -116,19 +262,7 @@ def get_user_journey(
     Get a specific user journey by ID.
     User can only view their own journeys.
     """
-    db_journey = crud.get_user_journey(db, journey_id)
-    if not db_journey:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="User journey not found"
-        )
-
-    if str(db_journey.user_id) != str(current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only view your own journeys",
-        )
-
-    return db_journey
+    return orm_json_response(_get_own_journey(db, journey_id, current_user))
 
 
 @router.put("/{journey_id}", response_model=UserJourney)
@@ -142,19 +276,14 @@ def update_user_journey(
     Update a user journey.
     User can only update their own journeys.
     """
-    db_journey = crud.get_user_journey(db, journey_id)
+    db_journey = crud.update_user_journey_for_user(
+        db, journey_id, str(current_user.id), journey
+    )
     if not db_journey:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User journey not found"
         )
-
-    if str(db_journey.user_id) != str(current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only update your own journeys",
-        )
-
-    db_journey = crud.update_user_journey(db, journey_id, journey)
+    invalidate_my_journeys_cache(str(current_user.id))
     return db_journey
 
 
@@ -167,24 +296,21 @@ def delete_user_journey(
     """
     Delete a user journey.
     User can only delete their own journeys.
+    Journeys that already have feedback cannot be deleted.
     """
-    db_journey = crud.get_user_journey(db, journey_id)
-    if not db_journey:
+    _check_own_journey(db, journey_id, current_user)
+    if crud.user_journey_has_feedback(db, journey_id):
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="User journey not found"
+            status_code=status.HTTP_409_CONFLICT,
+            detail="User journey has feedback and cannot be deleted",
         )
-
-    if str(db_journey.user_id) != str(current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only delete your own journeys",
-        )
-
-    success = crud.delete_user_journey(db, journey_id)
+    success = crud.delete_user_journey_for_user(db, journey_id, str(current_user.id))
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User journey not found"
         )
+    invalidate_my_journeys_cache(str(current_user.id))
+    cache_service.cache_delete(_journey_owner_cache_key(journey_id))
 
 
 # UserJourneyStop endpoints
@@ -203,17 +329,7 @@ def create_user_journey_stop(
     Add a stop to a user journey.
     User can only add stops to their own journeys.
     """
-    db_journey = crud.get_user_journey(db, journey_id)
-    if not db_journey:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="User journey not found"
-        )
-
-    if str(db_journey.user_id) != str(current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only add stops to your own journeys",
-        )
+    _check_own_journey(db, journey_id, current_user)
 
     return crud.create_user_journey_stop(db, journey_id, stop)
 
@@ -228,19 +344,9 @@ def get_user_journey_stops(
     Get all stops for a user journey.
     User can only view stops for their own journeys.
     """
-    db_journey = crud.get_user_journey(db, journey_id)
-    if not db_journey:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="User journey not found"
-        )
+    _check_own_journey(db, journey_id, current_user)
 
-    if str(db_journey.user_id) != str(current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only view stops for your own journeys",
-        )
-
-    return crud.get_user_journey_stops(db, journey_id)
+    return orm_json_response(crud.get_user_journey_stops(db, journey_id))
 
 
 @router.put("/stops/{stop_id}", response_model=UserJourneyStop)
@@ -254,22 +360,35 @@ def update_user_journey_stop(
     Update a user journey stop.
     User can only update stops in their own journeys.
     """
-    db_stop = crud.get_user_journey_stop(db, stop_id)
+    db_stop = crud.update_user_journey_stop_for_user(
+        db, stop_id, str(current_user.id), stop
+    )
     if not db_stop:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User journey stop not found"
         )
+    return db_stop
 
-    db_journey = crud.get_user_journey(db, str(db_stop.user_journey_id))
-    if db_journey and str(db_journey.user_id) != str(current_user.id):
+
+# Registered before /stops/{stop_id} so "batch" is not taken as a stop id
+@router.delete("/stops/batch", status_code=status.HTTP_204_NO_CONTENT)
+def delete_user_journey_stops(
+    stop_ids: List[str] = Body(..., min_length=1),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """
+    Delete several user journey stops at once.
+    All stops must belong to the user's own journeys, otherwise none are deleted.
+    """
+    success = crud.delete_user_journey_stops_for_user(
+        db, stop_ids, str(current_user.id)
+    )
+    if not success:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only update stops in your own journeys",
+            status_code=status.HTTP_404_NOT_FOUND, detail="User journey stop not found"
         )
 
-    db_stop = crud.update_user_journey_stop(db, stop_id, stop)
-    return db_stop
-
 
 @router.delete("/stops/{stop_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_user_journey_stop(
@@ -279,20 +398,7 @@ def delete_user_journey_stop(
     Delete a user journey stop.
     User can only delete stops from their own journeys.
     """
-    db_stop = crud.get_user_journey_stop(db, stop_id)
-    if not db_stop:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="User journey stop not found"
-        )
-
-    db_journey = crud.get_user_journey(db, str(db_stop.user_journey_id))
-    if db_journey and str(db_journey.user_id) != str(current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only delete stops from your own journeys",
-        )
-
-    success = crud.delete_user_journey_stop(db, stop_id)
+    success = crud.delete_user_journey_stop_for_user(db, stop_id, str(current_user.id))
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User journey stop not found"
@@ -309,17 +415,7 @@ def delete_all_stops_from_journey(
     Delete all stops from a user journey.
     User can only delete stops from their own journeys.
     """
-    db_journey = crud.get_user_journey(db, journey_id)
-    if not db_journey:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="User journey not found"
-        )
-
-    if str(db_journey.user_id) != str(current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only delete stops from your own journeys",
-        )
+    _check_own_journey(db, journey_id, current_user)
 
     crud.delete_all_user_journey_stops(db, journey_id)
 
@@ -327,6 +423,8 @@ def delete_all_stops_from_journey(
 @router.get("/{journey_id}/full-route", response_model=FullRouteResponse)
 def get_user_journey_full_route(
     journey_id: str,
+    request: Request,
+    epsilon: Optional[float] = Query(None, gt=0),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
@@ -334,83 +432,149 @@ def get_user_journey_full_route(
     Get the complete GPS route for a user journey.
     Returns all route segments and their GPS points in order.
     User can only view routes for their own journeys.
-    """
-    db_journey = crud.get_user_journey(db, journey_id)
-    if not db_journey:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="User journey not found"
-        )
 
-    if str(db_journey.user_id) != str(current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only view routes for your own journeys",
-        )
+    Pass epsilon (meters) to simplify each segment's points for map display.
+    """
+    _check_own_journey(db, journey_id, current_user)
 
-    journey_stops = crud.get_user_journey_stops(db, journey_id)
+    stop_ids = crud.get_user_journey_stop_ids(db, journey_id)
 
-    if len(journey_stops) < 2:
+    if len(stop_ids) < 2:
         return FullRouteResponse(
-            total_stops=len(journey_stops),
+            total_stops=len(stop_ids),
             total_segments=0,
             total_points=0,
             segments=[],
         )
 
-    segments = []
-    total_points = 0
+    # Two batched queries instead of two round trips per stop pair
+    stop_pairs = list(zip(stop_ids, stop_ids[1:]))
+    segments_by_pair = crud.get_route_segments_by_stop_pairs(db, stop_pairs)
 
-    for i in range(len(journey_stops) - 1):
-        from_stop = journey_stops[i]
-        to_stop = journey_stops[i + 1]
-
-        segment = crud.get_route_segment_by_stops(
-            db, str(from_stop.stop_id), str(to_stop.stop_id)
+    # The route only changes with the stop list, the segments joining it or
+    # their shapes' points (versioned by the precomputed points JSON that
+    # every shape-point write rebuilds), so clients holding it skip the load
+    shape_ids = [str(s.shape_id) for s in segments_by_pair.values()]
+    shape_versions = crud.get_shape_points_json_by_shape_ids(db, shape_ids)
+    etag_parts = [journey_id, epsilon, *stop_ids]
+    for pair in stop_pairs:
+        segment = segments_by_pair.get(pair)
+        shape_id = str(segment.shape_id) if segment else ""
+        etag_parts += [shape_id, shape_versions.get(shape_id) or ""]
+    etag = weak_etag(*etag_parts)
+    if etag_matches(request, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
         )
 
-        if segment:
-            points = crud.get_shape_points_by_shape_id(db, str(segment.shape_id))
-            total_points += len(points)
-
-            segments.append(
-                {
-                    "from_stop_id": from_stop.stop_id,
-                    "to_stop_id": to_stop.stop_id,
-                    "shape_id": segment.shape_id,
-                    "point_count": len(points),
-                    "points": [
-                        {
-                            "lat": p.shape_pt_lat,
-                            "lon": p.shape_pt_lon,
-                            "sequence": p.shape_pt_sequence,
-                            "distance": p.shape_dist_traveled,
-                        }
-                        for p in points
-                    ],
-                }
-            )
-        else:
-            segments.append(
-                {
-                    "from_stop_id": from_stop.stop_id,
-                    "to_stop_id": to_stop.stop_id,
-                    "shape_id": None,
-                    "point_count": 0,
-                    "points": [],
-                    "note": "No route segment defined between these stops",
-                }
-            )
+    points_by_shape = crud.get_shape_point_coords_by_shape_ids(db, shape_ids)
 
-    return FullRouteResponse(
-        total_stops=len(journey_stops),
-        total_segments=len(segments),
-        total_points=total_points,
-        segments=segments,
+    segment_rows = full_route_segment_rows(
+        stop_pairs, segments_by_pair, points_by_shape, epsilon_meters=epsilon
     )
 
+    # The session closes before streaming, so everything is fetched up front
+    response = full_route_response(len(stop_ids), segment_rows)
+    response.headers["ETag"] = etag
+    return response
+
+
+@lru_cache(maxsize=32)
+def _get_gmaps_client(api_key: str) -> googlemaps.Client:
+    """
+    Get a Google Maps client for the API key.
+
+    Clients are cached per key, so the configured key and any recently used
+    custom keys keep their keep-alive connection pools across requests.
+    """
+    client = googlemaps.Client(key=api_key)
+    # Room for all concurrent proposal variants of several requests
+    client.session.mount("https://", HTTPAdapter(pool_maxsize=50))
+    return client
+
+
+def _hashed_cache_key(prefix: str, *parts: str) -> str:
+    """
+    Build a fixed-length cache key from arbitrary request parts.
+
+    SHA-256 is marked non-security so FIPS builds allow it; OpenSSL uses the
+    CPU's SHA extensions where available, making it cheaper than MD5.
+    """
+    digest = sha256("|".join(parts).encode(), usedforsecurity=False)
+    return f"{prefix}:{digest.hexdigest()[:32]}"
+
+
+def _api_key_fingerprint(api_key: str) -> str:
+    """Hash an API key so cache keys separate callers without embedding it."""
+    return sha256(api_key.encode(), usedforsecurity=False).hexdigest()
+
+
+def _departure_minute(departure: datetime) -> str:
+    """Bucket a departure time to the minute, in UTC when it is tz-aware."""
+    if departure.tzinfo is not None:
+        departure = departure.astimezone(timezone.utc)
+    return departure.isoformat(timespec="minutes")
+
+
+def _cached_directions(gmaps: googlemaps.Client, params: dict) -> list:
+    """
+    Call the Directions API, reusing a cached response for the same variant.
+
+    The key buckets departure_time to the minute to raise the hit rate, and
+    includes the client's API key so callers never share each other's results.
+    """
+    key = _hashed_cache_key(
+        "directions",
+        "gmaps",
+        _api_key_fingerprint(gmaps.key),
+        str(params["origin"]),
+        str(params["destination"]),
+        _departure_minute(params["departure_time"]),
+        str(params.get("transit_routing_preference")),
+        ",".join(params["transit_mode"]),
+    )
+
+    cached = cache_service.cache_get(key)
+    if cached is not None:
+        return orjson.loads(cached)
+
+    routes = gmaps.directions(**params)  # type: ignore
+    cache_service.cache_set(key, orjson.dumps(routes), DIRECTIONS_CACHE_TTL_SECONDS)
+    return routes
+
+
+async def _query_departure_offsets(
+    gmaps: googlemaps.Client, variants: List[dict]
+) -> list:
+    """
+    Query one routing preference for increasing departure times, in order.
+
+    A variant is skipped (None) while the previous route still leaves at or
+    after its departure time, since Google would return that route again.
+    Failed calls are returned as the exception.
+    """
+    results: list = []
+    leaves_at = None
+    for params in variants:
+        if leaves_at is not None and leaves_at >= params["departure_time"].timestamp():
+            results.append(None)
+            continue
+
+        try:
+            routes = await asyncio.to_thread(_cached_directions, gmaps, params)
+        except Exception as e:
+            results.append(e)
+            leaves_at = None
+            continue
+
+        results.append(routes)
+        leg = routes[0]["legs"][0] if routes else {}
+        leaves_at = leg.get("departure_time", {}).get("value")
+    return results
+
 
 @router.post("/proposals", response_model=RouteProposalsResponse)
-def get_route_proposals(
+async def get_route_proposals(
     request: RouteProposalRequest,
     current_user=Depends(get_current_user),
 ):
@@ -426,17 +590,6 @@ def get_route_proposals(
     Returns:
         RouteProposalsResponse with list of route proposals
     """
-    # Google Maps type mapping to GTFS
-    GOOGLE_TO_GTFS = {
-        "BUS": (3, "bus"),
-        "TRAM": (0, "tram"),
-        "LIGHT_RAIL": (0, "tram"),
-        "HEAVY_RAIL": (2, "train"),
-        "COMMUTER_TRAIN": (2, "train"),
-        "SUBWAY": (2, "train"),
-        "RAIL": (2, "train"),
-    }
-
     # Use API key from request or fall back to environment variable
     api_key = request.api_key or settings.GOOGLE_MAPS_API_KEY
 
@@ -450,17 +603,31 @@ def get_route_proposals(
         )
 
     try:
-        gmaps = googlemaps.Client(key=api_key)
+        gmaps = _get_gmaps_client(api_key)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid Google Maps API key: {str(e)}",
         )
 
-    # Generate different query variants
-    variants = []
-    for mins in [0, 5, 10]:
-        for pref in [None, "less_walking", "fewer_transfers"]:
+    # Identical searches within the TTL are answered without touching Google
+    proposals_key = _hashed_cache_key(
+        "routeprop",
+        _api_key_fingerprint(api_key),
+        str(request.start_point),
+        str(request.destination),
+        _departure_minute(request.departure_datetime),
+    )
+    cached = await asyncio.to_thread(cache_service.cache_get, proposals_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    # Generate different query variants, grouped by routing preference
+    offsets = [0, 5, 10]
+    variants_by_pref = []
+    for pref in [None, "less_walking", "fewer_transfers"]:
+        pref_variants = []
+        for mins in offsets:
             params = {
                 "origin": request.start_point,
                 "destination": request.destination,
@@ -470,19 +637,27 @@ def get_route_proposals(
             }
             if pref:
                 params["transit_routing_preference"] = pref
-            variants.append(params)
+            pref_variants.append(params)
+        variants_by_pref.append(pref_variants)
+
+    # Preferences are queried concurrently; offsets within one preference run
+    # in order so repeats of an already-found route can be skipped
+    results_by_pref = await asyncio.gather(
+        *(_query_departure_offsets(gmaps, v) for v in variants_by_pref)
+    )
 
     proposals = []
     seen = set()
 
-    for p in variants:
-        try:
-            routes = gmaps.directions(**p)  # type: ignore
-        except Exception:
-            # Skip failed requests
-            continue
-
-        if not routes:
+    # Process in the original order: all preferences per departure offset
+    results = [
+        pref_results[i]
+        for i in range(len(offsets))
+        for pref_results in results_by_pref
+    ]
+    for routes in results:
+        # Skip failed and skipped requests
+        if isinstance(routes, BaseException) or not routes:
             continue
 
         r = routes[0]  # Take the best route for this variant
@@ -497,9 +672,10 @@ def get_route_proposals(
                 ]["line"].get("name")
                 headsign = step["transit_details"].get("headsign")
                 depart = step["transit_details"]["departure_time"]["value"]
-                transit_fingerprint.append(f"{line}|{headsign}|{depart}")
+                transit_fingerprint.append((line, headsign, depart))
 
-        key = md5("|".join(transit_fingerprint).encode()).hexdigest()
+        # Tuples hash natively; no digest needed for an in-memory set
+        key = tuple(transit_fingerprint)
         if key in seen:
             continue
         seen.add(key)
@@ -507,14 +683,14 @@ def get_route_proposals(
         # Extract step information
         steps_info = []
         for step in leg["steps"]:
-            gtfs_route_type, gtfs_mode = (None, "walk")
+            gtfs_route_type, gtfs_mode = WALK_GTFS
             departure_time = None
             arrival_time = None
 
             if step["travel_mode"] == "TRANSIT":
                 vehicle_type = step["transit_details"]["line"]["vehicle"]["type"]
                 gtfs_route_type, gtfs_mode = GOOGLE_TO_GTFS.get(
-                    vehicle_type, (None, "unknown")
+                    vehicle_type, UNKNOWN_GTFS
                 )
 
                 # Pobierz czasy odjazdu i przyjazdu dla transportu publicznego
@@ -551,7 +727,16 @@ def get_route_proposals(
             )
         )
 
-    return RouteProposalsResponse(proposals=proposals, total_proposals=len(proposals))
+    response = RouteProposalsResponse(
+        proposals=proposals, total_proposals=len(proposals)
+    )
+    body = response.model_dump_json().encode()
+    # Empty results usually mean transient Google failures; don't pin them
+    if proposals:
+        await asyncio.to_thread(
+            cache_service.cache_set, proposals_key, body, PROPOSALS_CACHE_TTL_SECONDS
+        )
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/{journey_id}/start", response_model=StartJourneyResponse)
@@ -571,18 +756,8 @@ def start_journey(
 
     Mobile app should call this when user begins their journey.
     """
-    # Get journey and verify ownership
-    db_journey = crud.get_user_journey(db, journey_id)
-    if not db_journey:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="User journey not found"
-        )
-
-    if str(db_journey.user_id) != str(current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only start your own journeys",
-        )
+    # Get journey with its stops and verify ownership in one round-trip
+    db_journey = _get_own_journey(db, journey_id, current_user, with_stops=True)
 
     # Check if already in progress
     if bool(db_journey.is_in_progress):
@@ -591,13 +766,7 @@ def start_journey(
             detail="Journey is already in progress",
         )
 
-    # Get journey stops
-    journey_stops = (
-        db.query(UserJourneyStopDB)
-        .filter(UserJourneyStopDB.user_journey_id == journey_id)
-        .order_by(UserJourneyStopDB.stop_order)
-        .all()
-    )
+    journey_stops = db_journey.stops
 
     if len(journey_stops) < 2:
         raise HTTPException(
@@ -605,8 +774,8 @@ def start_journey(
             detail="Journey must have at least 2 stops to start",
         )
 
-    # Calculate total distance
-    total_distance = journey_tracking.calculate_total_route_distance(db, journey_id)
+    # Calculate total distance from the stops loaded above
+    total_distance = journey_tracking.calculate_route_distance(db, journey_stops)
 
     # Estimate arrival time (assuming 30 km/h average speed)
     estimated_duration_minutes = None
@@ -619,24 +788,19 @@ def start_journey(
             minutes=estimated_duration_minutes
         )
 
-    # Update journey status
+    # Update journey status; the guarded UPDATE loses to a concurrent start
     now = datetime.now()
-    db_journey_model = (
-        db.query(UserJourneyDB).filter(UserJourneyDB.id == journey_id).first()
-    )
-
-    if db_journey_model:
-        db_journey_model.is_in_progress = True  # type: ignore
-        db_journey_model.started_at = now  # type: ignore
-        db_journey_model.current_stop_index = 0  # type: ignore
-        db_journey_model.ended_at = None  # type: ignore
-        db.commit()
-        db.refresh(db_journey_model)
+    if not crud.start_user_journey_for_user(db, journey_id, str(current_user.id), now):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Journey is already in progress",
+        )
+    invalidate_my_journeys_cache(str(current_user.id))
 
     return StartJourneyResponse(
         success=True,
         message="Journey started successfully",
-        journey_id=UUID(str(db_journey.id)),
+        journey_id=UUID(journey_id),
         started_at=now,
         estimated_arrival=estimated_arrival,
         total_stops=len(journey_stops),
@@ -660,36 +824,17 @@ def end_journey(
 
     Mobile app should call this when user completes their journey.
     """
-    # Get journey and verify ownership
-    db_journey = crud.get_user_journey(db, journey_id)
+    # Ownership and state are checked by the UPDATE itself
+    db_journey = crud.end_user_journey_for_user(
+        db, journey_id, str(current_user.id), datetime.now()
+    )
     if not db_journey:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="User journey not found"
-        )
-
-    if str(db_journey.user_id) != str(current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only end your own journeys",
-        )
-
-    # Check if in progress
-    if not bool(db_journey.is_in_progress):
+        # Only on failure: tell a missing journey apart from one not running
+        _get_own_journey(db, journey_id, current_user)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Journey is not in progress",
         )
+    invalidate_my_journeys_cache(str(current_user.id))
 
-    # Update journey status
-    now = datetime.now()
-    db_journey_model = (
-        db.query(UserJourneyDB).filter(UserJourneyDB.id == journey_id).first()
-    )
-
-    if db_journey_model:
-        db_journey_model.is_in_progress = False  # type: ignore
-        db_journey_model.ended_at = now  # type: ignore
-        db.commit()
-        db.refresh(db_journey_model)
-
-    return crud.get_user_journey(db, journey_id)
+    return db_journey
@@ -1,8 +1,9 @@
 import crud
 from database import get_db
-from dependencies import get_current_user
-from fastapi import APIRouter, Depends, HTTPException, status
+from dependencies import CurrentUser, get_current_user, invalidate_current_user_cache
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from models import User, UserPublic, UserUpdate
+from routers.utils import etag_matches, get_or_404, weak_etag
 from sqlalchemy.orm import Session
 
 router = APIRouter(prefix="/users", tags=["users"])
@@ -10,7 +11,8 @@ router = APIRouter(prefix="/users", tags=["users"])
 
 @router.get("/me", response_model=User)
 def get_current_user_profile(
-    current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: Session = Depends(get_db),
 ):
     """Get full profile for the currently authenticated user."""
     db_user = crud.get_user(db, str(current_user.id))
@@ -22,13 +24,21 @@ def get_current_user_profile(
 
 
 @router.get("/{user_id}", response_model=UserPublic)
-def get_user_public(user_id: str, db: Session = Depends(get_db)):
+def get_user_public(
+    user_id: str, request: Request, response: Response, db: Session = Depends(get_db)
+):
     """Get public user profile (name, badge, verified reports count)."""
-    db_user = crud.get_user(db, user_id)
-    if not db_user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
-        )
+    db_user = get_or_404(crud.get_user, db, user_id, "User")
+
+    # Tagged by every public field: report verification changes badge and
+    # verified_reports_count without touching updated_at
+    etag = weak_etag(
+        db_user.id, db_user.name, db_user.badge, db_user.verified_reports_count
+    )
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=30"}
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
     return db_user
 
 
@@ -36,7 +46,7 @@ def get_user_public(user_id: str, db: Session = Depends(get_db)):
 def update_user(
     user_id: str,
     user_update: UserUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Update user profile. Users can only edit their own profile."""
@@ -50,4 +60,5 @@ def update_user(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
+    invalidate_current_user_cache(user_id)
     return db_user
@@ -0,0 +1,245 @@
+"""
+Shared helpers for route handlers.
+"""
+
+from hashlib import sha256
+from math import cos, radians
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+import orjson
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from services import cache_service
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+
+def active_journey_cache_key(user_id: str) -> str:
+    return f"user-journeys:active:{user_id}"
+
+
+def saved_journeys_cache_key(user_id: str) -> str:
+    return f"user-journeys:saved:{user_id}"
+
+
+def invalidate_my_journeys_cache(user_id: str) -> None:
+    """Drop the cached /user-journeys/my/active and /my/saved responses."""
+    cache_service.cache_delete(
+        active_journey_cache_key(user_id), saved_journeys_cache_key(user_id)
+    )
+
+
+def cached_json_response(
+    key: str, adapter: TypeAdapter, load: Callable[[], object], ttl_seconds: int
+) -> Response:
+    """
+    Serve a cached JSON body, or build it from load() and cache it.
+
+    load() runs only on a miss; any HTTPException it raises is not cached.
+    """
+    body = cache_service.cache_get(key)
+    if body is None:
+        body = adapter.dump_json(adapter.validate_python(load(), from_attributes=True))
+        cache_service.cache_set(key, body, ttl_seconds)
+    return Response(content=body, media_type="application/json")
+
+
+def _etag(data: bytes, weak: bool = True) -> str:
+    digest = sha256(data, usedforsecurity=False).hexdigest()[:32]
+    return f'W/"{digest}"' if weak else f'"{digest}"'
+
+
+def weak_etag(*parts: object) -> str:
+    """Build a weak ETag from the values a response was derived from."""
+    return _etag("|".join(map(str, parts)).encode())
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match already names this ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return header.strip() == "*" or etag in (tag.strip() for tag in header.split(","))
+
+
+def conditional_response(
+    request: Request, response: Response, cache_control: str
+) -> Response:
+    """
+    Tag a fully built response with a strong ETag of its body and
+    Cache-Control.
+
+    Returns an empty 304 instead when the client already has that body.
+    """
+    etag = _etag(response.body, weak=False)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return response
+
+
+def get_or_404(
+    loader: Callable[[Session, str], Optional[T]], db: Session, id_: str, name: str
+) -> T:
+    """
+    Load an object with a CRUD getter or raise 404 "<name> not found".
+
+    A new HTTPException is raised on every miss: a shared instance would
+    accumulate tracebacks (keeping request frames alive) and is not safe
+    to raise from concurrent threadpool workers.
+    """
+    obj = loader(db, id_)
+    if obj is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"{name} not found"
+        )
+    return obj
+
+
+def _column_values(obj) -> dict:
+    column_attrs = inspect(obj).mapper.column_attrs
+    return {attr.key: getattr(obj, attr.key) for attr in column_attrs}
+
+
+def orm_json_response(data) -> Response:
+    """
+    Serialize ORM objects' column values straight to a JSON response.
+
+    Bypasses response_model validation, so use it only on endpoints whose
+    schema mirrors the table's columns one-to-one.
+    """
+    if data is None:
+        payload = None
+    elif isinstance(data, list):
+        payload = [_column_values(obj) for obj in data]
+    else:
+        payload = _column_values(data)
+    return Response(content=orjson.dumps(payload), media_type="application/json")
+
+
+# Meters per degree of latitude (and of longitude at the equator)
+_METERS_PER_DEGREE = 111_320.0
+
+
+def simplify_points(points: List[tuple], epsilon_meters: float) -> List[tuple]:
+    """
+    Simplify a polyline of (lat, lon, ...) rows with Ramer-Douglas-Peucker.
+
+    Points closer than ``epsilon_meters`` to the simplified line are dropped;
+    the first and last points are always kept. Coordinates are projected onto
+    a local flat plane, which is accurate at the scale of a route segment.
+    """
+    if len(points) < 3:
+        return points
+
+    lon_scale = cos(radians(points[0][0]))
+    xs = [p[1] * lon_scale * _METERS_PER_DEGREE for p in points]
+    ys = [p[0] * _METERS_PER_DEGREE for p in points]
+    epsilon_sq = epsilon_meters * epsilon_meters
+
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    # Iterative to stay clear of the recursion limit on long shapes
+    stack = [(0, len(points) - 1)]
+    while stack:
+        start, end = stack.pop()
+        ax, ay = xs[start], ys[start]
+        dx, dy = xs[end] - ax, ys[end] - ay
+        length_sq = dx * dx + dy * dy
+
+        max_dist_sq, max_index = 0.0, 0
+        for i in range(start + 1, end):
+            px, py = xs[i] - ax, ys[i] - ay
+            if length_sq:
+                # Squared distance to the segment, with the projection clamped
+                t = min(1.0, max(0.0, (px * dx + py * dy) / length_sq))
+                px, py = px - t * dx, py - t * dy
+            dist_sq = px * px + py * py
+            if dist_sq > max_dist_sq:
+                max_dist_sq, max_index = dist_sq, i
+
+        if max_dist_sq > epsilon_sq:
+            keep[max_index] = True
+            stack.append((start, max_index))
+            stack.append((max_index, end))
+
+    return [point for point, kept in zip(points, keep) if kept]
+
+
+def full_route_segment_rows(
+    stop_pairs: List[Tuple[str, str]],
+    segments_by_pair: dict,
+    points_by_shape: Dict[str, List[tuple]],
+    keep_missing: bool = True,
+    epsilon_meters: Optional[float] = None,
+) -> List[tuple]:
+    """
+    Assemble (from_stop_id, to_stop_id, shape_id, points) rows for a route.
+
+    Pairs without a route segment get a (from, to, None, []) row, or are
+    dropped when ``keep_missing`` is False. With ``epsilon_meters`` each
+    segment's points are simplified (see simplify_points).
+    """
+    segment_rows = []
+    for stop_pair in stop_pairs:
+        segment = segments_by_pair.get(stop_pair)
+        if segment:
+            shape_id = str(segment.shape_id)
+            points = points_by_shape.get(shape_id, [])
+            if epsilon_meters:
+                points = simplify_points(points, epsilon_meters)
+            segment_rows.append((*stop_pair, shape_id, points))
+        elif keep_missing:
+            segment_rows.append((*stop_pair, None, []))
+    return segment_rows
+
+
+def _pack_point(row: tuple) -> dict:
+    """Turn a (lat, lon, sequence, distance) row into a full-route point."""
+    lat, lon, sequence, distance = row
+    return {"lat": lat, "lon": lon, "sequence": sequence, "distance": distance}
+
+
+def _stream_full_route(total_stops: int, segment_rows: List[tuple]) -> Iterator[bytes]:
+    """
+    Yield a FullRouteResponse JSON document one segment at a time.
+
+    segment_rows holds (from_stop_id, to_stop_id, shape_id, points) tuples,
+    with shape_id None when no route segment joins the two stops.
+    """
+    total_points = sum(len(row[3]) for row in segment_rows)
+    yield b'{"total_stops":%d,"total_segments":%d,"total_points":%d,"segments":[' % (
+        total_stops,
+        len(segment_rows),
+        total_points,
+    )
+
+    for i, (from_stop_id, to_stop_id, shape_id, points) in enumerate(segment_rows):
+        segment = {
+            "from_stop_id": from_stop_id,
+            "to_stop_id": to_stop_id,
+            "shape_id": shape_id,
+            "point_count": len(points),
+            "points": list(map(_pack_point, points)),
+        }
+        if shape_id is None:
+            segment["note"] = "No route segment defined between these stops"
+        yield (b"," if i else b"") + orjson.dumps(segment)
+
+    yield b"]}"
+
+
+def full_route_response(total_stops: int, segment_rows: List[tuple]) -> Response:
+    """
+    Stream a FullRouteResponse body for the given segment rows.
+
+    Points stay compact tuples until their segment is written out, so peak
+    memory is one encoded segment rather than the whole document.
+    """
+    return StreamingResponse(
+        _stream_full_route(total_stops, segment_rows), media_type="application/json"
+    )
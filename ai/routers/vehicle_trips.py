@@ -1,10 +1,15 @@
-from typing import List
+from typing import List, Optional
 
 import crud
 from database import get_db
 from dependencies import require_admin, require_driver_or_dispatcher
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from models import FullRouteResponse, VehicleTrip, VehicleTripCreate, VehicleTripUpdate
+from routers.utils import (
+    full_route_response,
+    full_route_segment_rows,
+    get_or_404,
+)
 from sqlalchemy.orm import Session
 
 router = APIRouter(prefix="/vehicle-trips", tags=["vehicle-trips"])
@@ -29,11 +34,9 @@ def get_all_vehicle_trips(
 
 @router.get("/{vehicle_trip_id}", response_model=VehicleTrip)
 def get_vehicle_trip(vehicle_trip_id: str, db: Session = Depends(get_db)):
-    db_vehicle_trip = crud.get_vehicle_trip(db, vehicle_trip_id)
-    if not db_vehicle_trip:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Vehicle trip not found"
-        )
+    db_vehicle_trip = get_or_404(
+        crud.get_vehicle_trip, db, vehicle_trip_id, "Vehicle trip"
+    )
     return db_vehicle_trip
 
 
@@ -69,76 +72,47 @@ def delete_vehicle_trip(
 
 
 @router.get("/{vehicle_trip_id}/full-route", response_model=FullRouteResponse)
-def get_vehicle_trip_full_route(vehicle_trip_id: str, db: Session = Depends(get_db)):
+def get_vehicle_trip_full_route(
+    vehicle_trip_id: str,
+    epsilon: Optional[float] = Query(None, gt=0),
+    db: Session = Depends(get_db),
+):
     """
     Get the complete GPS route for a vehicle trip.
     Returns all route segments and their GPS points in order.
+
+    Pass epsilon (meters) to simplify each segment's points for map display.
     """
     # Get vehicle trip
-    db_vehicle_trip = crud.get_vehicle_trip(db, vehicle_trip_id)
-    if not db_vehicle_trip:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Vehicle trip not found"
-        )
-
-    # Get route stops for this trip
-    route_stops = crud.get_route_stops(db)
-    route_stops = [
-        rs for rs in route_stops if str(rs.route_id) == str(db_vehicle_trip.route_id)
-    ]
-
-    # Sort by scheduled time (arrival or departure)
-    def get_sort_key(rs):
-        arrival = getattr(rs, "scheduled_arrival", None)
-        departure = getattr(rs, "scheduled_departure", None)
-        return arrival if arrival else (departure if departure else "")
+    db_vehicle_trip = get_or_404(
+        crud.get_vehicle_trip, db, vehicle_trip_id, "Vehicle trip"
+    )
 
-    route_stops = sorted(route_stops, key=get_sort_key)
+    # Get this trip's route stops in schedule order
+    route_stops = crud.get_route_stops_by_route_id(db, str(db_vehicle_trip.route_id))
 
     if not route_stops:
         return FullRouteResponse(
             total_stops=0, total_segments=0, total_points=0, segments=[]
         )
 
-    # Build segments between consecutive stops
-    segments = []
-    total_points = 0
-
-    for i in range(len(route_stops) - 1):
-        from_stop = route_stops[i]
-        to_stop = route_stops[i + 1]
-
-        # Find route segment between these stops
-        segment = crud.get_route_segment_by_stops(
-            db, str(from_stop.stop_id), str(to_stop.stop_id)
-        )
+    # Fetch all segments and their points in two queries
+    stop_pairs = [
+        (str(from_stop.stop_id), str(to_stop.stop_id))
+        for from_stop, to_stop in zip(route_stops, route_stops[1:])
+    ]
+    segments_by_pair = crud.get_route_segments_by_stop_pairs(db, stop_pairs)
+    points_by_shape = crud.get_shape_point_coords_by_shape_ids(
+        db, [str(segment.shape_id) for segment in segments_by_pair.values()]
+    )
 
-        if segment:
-            # Get all GPS points for this segment
-            points = crud.get_shape_points_by_shape_id(db, str(segment.shape_id))
-            total_points += len(points)
-
-            segments.append(
-                {
-                    "from_stop_id": from_stop.stop_id,
-                    "to_stop_id": to_stop.stop_id,
-                    "shape_id": segment.shape_id,
-                    "point_count": len(points),
-                    "points": [
-                        {
-                            "lat": p.shape_pt_lat,
-                            "lon": p.shape_pt_lon,
-                            "sequence": p.shape_pt_sequence,
-                            "distance": p.shape_dist_traveled,
-                        }
-                        for p in points
-                    ],
-                }
-            )
-
-    return FullRouteResponse(
-        total_stops=len(route_stops),
-        total_segments=len(segments),
-        total_points=total_points,
-        segments=segments,
+    # Stop pairs without a route segment are left out of the route
+    segment_rows = full_route_segment_rows(
+        stop_pairs,
+        segments_by_pair,
+        points_by_shape,
+        keep_missing=False,
+        epsilon_meters=epsilon,
     )
+
+    return full_route_response(len(route_stops), segment_rows)
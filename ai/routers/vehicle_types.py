@@ -2,33 +2,50 @@ from typing import List
 
 import crud
 from database import get_db
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Request
 from models import VehicleType
+from pydantic import TypeAdapter
+from routers.utils import cached_json_response, conditional_response, get_or_404
 from sqlalchemy.orm import Session
 
 router = APIRouter(prefix="/vehicle-types", tags=["vehicle-types"])
 
+# Vehicle types are seeded at startup and never change through the API
+VEHICLE_TYPES_CACHE_TTL_SECONDS = 3600
+VEHICLE_TYPES_CACHE_CONTROL = "public, max-age=3600"
+_VEHICLE_TYPE_ADAPTER = TypeAdapter(VehicleType)
+_VEHICLE_TYPES_ADAPTER = TypeAdapter(List[VehicleType])
+
 
 @router.get("/", response_model=List[VehicleType])
 def get_all_vehicle_types(
-    skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
+    request: Request, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
 ):
     """
     Get all vehicle types (read-only).
     Vehicle types are system-defined and cannot be created or modified by users.
     """
-    return crud.get_vehicle_types(db, skip=skip, limit=limit)
+    response = cached_json_response(
+        f"vehicle-types:list:{skip}:{limit}",
+        _VEHICLE_TYPES_ADAPTER,
+        lambda: crud.get_vehicle_types(db, skip=skip, limit=limit),
+        VEHICLE_TYPES_CACHE_TTL_SECONDS,
+    )
+    return conditional_response(request, response, VEHICLE_TYPES_CACHE_CONTROL)
 
 
 @router.get("/{vehicle_type_id}", response_model=VehicleType)
-def get_vehicle_type(vehicle_type_id: str, db: Session = Depends(get_db)):
+def get_vehicle_type(
+    vehicle_type_id: str, request: Request, db: Session = Depends(get_db)
+):
     """
     Get a specific vehicle type by ID (read-only).
     Vehicle types are system-defined and cannot be created or modified by users.
     """
-    db_vehicle_type = crud.get_vehicle_type(db, vehicle_type_id)
-    if not db_vehicle_type:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="VehicleType not found"
-        )
-    return db_vehicle_type
+    response = cached_json_response(
+        f"vehicle-types:{vehicle_type_id}",
+        _VEHICLE_TYPE_ADAPTER,
+        lambda: get_or_404(crud.get_vehicle_type, db, vehicle_type_id, "VehicleType"),
+        VEHICLE_TYPES_CACHE_TTL_SECONDS,
+    )
+    return conditional_response(request, response, VEHICLE_TYPES_CACHE_CONTROL)
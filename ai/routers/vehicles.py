@@ -1,14 +1,30 @@
+from functools import partial
 from typing import List
 
 import crud
+from config import settings
 from database import get_db
 from dependencies import require_admin, require_admin_or_dispatcher
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from models import Vehicle, VehicleCreate, VehicleUpdate
+from pydantic import TypeAdapter
+from routers.utils import cached_json_response, conditional_response, get_or_404
+from services import cache_service
 from sqlalchemy.orm import Session
 
 router = APIRouter(prefix="/vehicles", tags=["vehicles"])
 
+# Cached vehicle bodies are dropped on update/delete; the TTL only bounds
+# staleness if a write ever bypasses this router. Clients always revalidate.
+VEHICLE_CACHE_TTL_SECONDS = 300
+VEHICLE_CACHE_CONTROL = "no-cache"
+_VEHICLE_ADAPTER = TypeAdapter(Vehicle)
+_VEHICLES_ADAPTER = TypeAdapter(List[Vehicle])
+
+
+def _vehicle_cache_key(vehicle_id: str) -> str:
+    return f"vehicles:{vehicle_id}"
+
 
 @router.post("/", response_model=Vehicle, status_code=status.HTTP_201_CREATED)
 def create_vehicle(
@@ -22,17 +38,26 @@ def create_vehicle(
 
 @router.get("/", response_model=List[Vehicle])
 def get_all_vehicles(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return crud.get_vehicles(db, skip=skip, limit=limit)
+    vehicles = crud.get_vehicles(
+        db, skip=skip, limit=limit, strict=settings.STRICT_LOADING
+    )
+    # Validate and dump with one prebuilt adapter, straight to JSON bytes
+    body = _VEHICLES_ADAPTER.dump_json(
+        _VEHICLES_ADAPTER.validate_python(vehicles, from_attributes=True)
+    )
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/{vehicle_id}", response_model=Vehicle)
-def get_vehicle(vehicle_id: str, db: Session = Depends(get_db)):
-    db_vehicle = crud.get_vehicle(db, vehicle_id)
-    if not db_vehicle:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Vehicle not found"
-        )
-    return db_vehicle
+def get_vehicle(vehicle_id: str, request: Request, db: Session = Depends(get_db)):
+    loader = partial(crud.get_vehicle, strict=settings.STRICT_LOADING)
+    response = cached_json_response(
+        _vehicle_cache_key(vehicle_id),
+        _VEHICLE_ADAPTER,
+        lambda: get_or_404(loader, db, vehicle_id, "Vehicle"),
+        VEHICLE_CACHE_TTL_SECONDS,
+    )
+    return conditional_response(request, response, VEHICLE_CACHE_CONTROL)
 
 
 @router.put("/{vehicle_id}", response_model=Vehicle)
@@ -48,6 +73,7 @@ def update_vehicle(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Vehicle not found"
         )
+    cache_service.cache_delete(_vehicle_cache_key(vehicle_id))
     return db_vehicle
 
 
@@ -61,3 +87,4 @@ def delete_vehicle(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Vehicle not found"
         )
+    cache_service.cache_delete(_vehicle_cache_key(vehicle_id))
@@ -14,15 +14,27 @@ Example flow:
 4. System creates UserJourney
 """
 
+import asyncio
 from typing import Optional
 
 from database import get_db
-from dependencies import get_current_user
+from dependencies import CurrentUser, get_current_user
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
-from models import User
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
+try:
+    from services.whisper_service import transcribe_audio as whisper_transcribe
+except ImportError:
+    whisper_transcribe = None  # type: ignore
+
+try:
+    from services.gemini_service import process_journey_command
+    from services.gemini_service import warmup as gemini_warmup
+except ImportError:
+    process_journey_command = None  # type: ignore
+    gemini_warmup = None  # type: ignore
+
 router = APIRouter(prefix="/voice-assistant", tags=["Voice Assistant"])
 
 
@@ -51,7 +63,7 @@ class VoiceCommandResponse(BaseModel):
 )
 async def transcribe_audio(
     audio: UploadFile = File(..., description="Audio file (mp3, wav, m4a, etc.)"),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """
     Transcribe audio file to text using OpenAI Whisper.
@@ -66,9 +78,7 @@ async def transcribe_audio(
     - Detected language
     - Audio duration
     """
-    try:
-        from services.whisper_service import transcribe_audio as whisper_transcribe
-    except ImportError:
+    if whisper_transcribe is None:
         raise HTTPException(
             status_code=status.HTTP_501_NOT_IMPLEMENTED,
             detail="Whisper service not configured. Install: pip install openai",
@@ -82,10 +92,8 @@ async def transcribe_audio(
             detail=f"Unsupported audio format: {audio.content_type}",
         )
 
-    # Read audio file
-    audio_bytes = await audio.read()
-
-    if len(audio_bytes) == 0:
+    # The upload stays in its spooled temp file; only its size is checked here
+    if audio.size == 0:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Empty audio file",
@@ -93,7 +101,7 @@ async def transcribe_audio(
 
     # Transcribe
     try:
-        result = await whisper_transcribe(audio_bytes, audio.filename or "audio.mp3")
+        result = await whisper_transcribe(audio.file, audio.filename or "audio.mp3")
         return TranscriptionResponse(**result)
     except Exception as e:
         raise HTTPException(
@@ -110,7 +118,7 @@ async def transcribe_audio(
 async def process_voice_command(
     audio: UploadFile = File(..., description="Audio file with voice command"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """
     Full voice command processing pipeline:
@@ -131,24 +139,28 @@ async def process_voice_command(
     - Journey ID (if created/updated)
     """
     # Step 1: Transcribe audio
-    try:
-        from services.whisper_service import transcribe_audio as whisper_transcribe
-    except ImportError:
+    if whisper_transcribe is None:
         raise HTTPException(
             status_code=status.HTTP_501_NOT_IMPLEMENTED,
             detail="Whisper service not configured",
         )
 
-    audio_bytes = await audio.read()
-    transcription_result = await whisper_transcribe(
-        audio_bytes, audio.filename or "audio.mp3"
-    )
+    # Set up the Gemini client while the audio is transcribed on a worker thread
+    warmup = None
+    if gemini_warmup is not None:
+        warmup = asyncio.create_task(asyncio.to_thread(gemini_warmup))
+
+    try:
+        transcription_result = await whisper_transcribe(
+            audio.file, audio.filename or "audio.mp3"
+        )
+    finally:
+        if warmup is not None:
+            await asyncio.gather(warmup, return_exceptions=True)
     transcription_text = transcription_result["text"]
 
     # Step 2: Process with Gemini
-    try:
-        from services.gemini_service import process_journey_command
-    except ImportError:
+    if process_journey_command is None:
         raise HTTPException(
             status_code=status.HTTP_501_NOT_IMPLEMENTED,
             detail="Gemini service not configured",
@@ -213,7 +225,7 @@ async def process_voice_command(
 async def process_text_command(
     command: str = Form(..., description="Text command"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """
     Process text command directly (skip audio transcription).
@@ -228,9 +240,7 @@ async def process_text_command(
     command: "Chcę jechać z Dworca Centralnego do Mokotowa jutro o 8 rano"
     ```
     """
-    try:
-        from services.gemini_service import process_journey_command
-    except ImportError:
+    if process_journey_command is None:
         raise HTTPException(
             status_code=status.HTTP_501_NOT_IMPLEMENTED,
             detail="Gemini service not configured",
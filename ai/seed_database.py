@@ -14,17 +14,18 @@ Run this script:
 """
 
 import csv
+import io
 import os
 import shutil
-import sqlite3
 import sys
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from random import choice, randint, uniform
-from urllib.request import urlretrieve
+from urllib.request import urlopen
 
 import pandas as pd
-from database import SessionLocal, init_db
+from database import SessionLocal, engine, init_db
 from db_models import (
     JourneyData,
     Report,
@@ -40,48 +41,88 @@ from db_models import (
     Vehicle,
     VehicleTrip,
     VehicleType,
+    generate_uuid,
 )
 from init_data import VEHICLE_TYPES
+from sqlalchemy import event
 from tqdm import tqdm
 
+# pyarrow parses CSV multithreaded; pandas' C parser is the fallback
+try:
+    import pyarrow  # noqa: F401
+
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
 # ============================================================================
 # GTFS DATA HELPERS
 # ============================================================================
 
+# Rows per bulk INSERT; bounds the size of each executemany batch
+BULK_INSERT_CHUNK_SIZE = 10_000
+
+
+def chunked(rows, size=BULK_INSERT_CHUNK_SIZE):
+    """Yield consecutive slices of at most ``size`` rows."""
+    for start in range(0, len(rows), size):
+        yield rows[start : start + size]
+
+
+# The stop_times.txt columns the seed uses, with explicit types so pandas skips
+# type inference and keeps IDs as strings even when they look numeric
+STOP_TIMES_DTYPES = {
+    "trip_id": str,
+    "arrival_time": str,
+    "departure_time": str,
+    "stop_id": str,
+    "stop_sequence": "int32",
+}
+
+
+def read_stop_times(path):
+    """Load a GTFS stop_times.txt with only the columns the seed needs."""
+    return pd.read_csv(
+        path,
+        usecols=list(STOP_TIMES_DTYPES),
+        dtype=STOP_TIMES_DTYPES,
+        engine=CSV_ENGINE,
+    )
+
 
-def parse_gtfs_time(time_str):
+def parse_gtfs_times(times, base_date=None):
     """
-    Convert GTFS time string to datetime object.
+    Convert a Series of GTFS time strings to datetime objects in one pass.
 
     GTFS times can exceed 24:00:00 for trips that continue after midnight.
     For example, '25:30:00' means 1:30 AM the next day.
 
     Args:
-        time_str: Time string in format 'HH:MM:SS'
+        times: Series of time strings in format 'HH:MM:SS'
+        base_date: Midnight of the service day (defaults to today)
 
     Returns:
-        datetime object or None if input is invalid
+        Series of datetime objects, None where the input is missing
     """
-    if not time_str or pd.isna(time_str):
-        return None
-
-    # Parse time components
-    parts = time_str.strip().split(":")
-    hours = int(parts[0])
-    minutes = int(parts[1])
-    seconds = int(parts[2])
-
-    # Handle times that exceed 24 hours (next day service)
-    days = hours // 24
-    hours = hours % 24
-
-    # Create datetime using today as base reference
-    base_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-    result = base_date + timedelta(
-        days=days, hours=hours, minutes=minutes, seconds=seconds
+    if base_date is None:
+        base_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+    # Split all strings at once and add the parts up as seconds past midnight;
+    # missing times stay NaN through the arithmetic and become None at the end
+    parts = (
+        times.astype("string")
+        .str.strip()
+        .str.split(":", expand=True)
+        .reindex(columns=range(3))
     )
+    seconds = (
+        parts[0].astype("float64") * 3600
+        + parts[1].astype("float64") * 60
+        + parts[2].astype("float64")
+    )
+    result = pd.Timestamp(base_date) + pd.to_timedelta(seconds, unit="s")
 
-    return result
+    return result.astype(object).where(result.notna(), None)
 
 
 def get_vehicle_type_mapping(vehicle_types):
@@ -89,18 +130,21 @@ def get_vehicle_type_mapping(vehicle_types):
     Create a mapping of vehicle type codes to vehicle type objects.
 
     Returns:
-        dict: Mapping of folder names to (folder_path, vehicle_type) tuples
+        list: (folder_path, vehicle_type) tuples, one per GTFS feed
     """
-    bus_type = next(vt for vt in vehicle_types if vt.code == "BUS")
-    tram_type = next(vt for vt in vehicle_types if vt.code == "TRAM")
-    train_type = next(vt for vt in vehicle_types if vt.code == "TRAIN")
-
-    return [
-        ("GTFS_KRK_A", bus_type),  # Buses
-        ("GTFS_KRK_T", tram_type),  # Trams
-        ("GTFS_KRK_M", train_type),  # Metro/Train
+    by_code = {vt.code: vt for vt in vehicle_types}
+    feed_codes = [
+        ("GTFS_KRK_A", "BUS"),  # Buses
+        ("GTFS_KRK_T", "TRAM"),  # Trams
+        ("GTFS_KRK_M", "TRAIN"),  # Metro/Train
     ]
 
+    missing = [code for _, code in feed_codes if code not in by_code]
+    if missing:
+        raise KeyError(f"Vehicle types not seeded: {', '.join(missing)}")
+
+    return [(folder, by_code[code]) for folder, code in feed_codes]
+
 
 # ============================================================================
 # GTFS DATA DOWNLOAD & CLEANUP
@@ -114,42 +158,55 @@ GTFS_URLS = [
 ]
 
 
+def _download_feed(url, folder_name):
+    """Download and extract a single GTFS feed; cleans up after a failure."""
+    try:
+        print(f"   • Downloading {folder_name}...")
+        # GTFS ZIPs fit comfortably in memory, so skip writing them to disk
+        with urlopen(url) as response:
+            archive = io.BytesIO(response.read())
+
+        print(f"   • Extracting {folder_name}...")
+        with zipfile.ZipFile(archive, "r") as zip_ref:
+            zip_ref.extractall(folder_name)
+
+        print(f"   ✓ {folder_name} ready")
+
+    except Exception as e:
+        print(f"   ❌ Failed to download {folder_name}: {e}")
+        # Clean up partial extraction
+        if os.path.exists(folder_name):
+            shutil.rmtree(folder_name)
+        raise
+
+
 def download_gtfs_data():
     """
     Download and extract GTFS data from Krakow transport authority.
 
     Downloads ZIP files and extracts them to local folders.
     Skips download if folder already exists.
+    Feeds are downloaded in parallel; if any of them fails, the first error
+    is raised once all downloads have finished.
     """
     print("\n📥 Downloading GTFS data...")
 
+    pending = []
     for url, folder_name in GTFS_URLS:
         if os.path.exists(folder_name):
             print(f"   • {folder_name} already exists, skipping download")
             continue
-
-        zip_filename = f"{folder_name}.zip"
-
-        try:
-            print(f"   • Downloading {folder_name}...")
-            urlretrieve(url, zip_filename)
-
-            print(f"   • Extracting {folder_name}...")
-            with zipfile.ZipFile(zip_filename, "r") as zip_ref:
-                zip_ref.extractall(folder_name)
-
-            # Remove ZIP file after extraction
-            os.remove(zip_filename)
-            print(f"   ✓ {folder_name} ready")
-
-        except Exception as e:
-            print(f"   ❌ Failed to download {folder_name}: {e}")
-            # Clean up partial downloads
-            if os.path.exists(zip_filename):
-                os.remove(zip_filename)
-            if os.path.exists(folder_name):
-                shutil.rmtree(folder_name)
-            raise
+        pending.append((url, folder_name))
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            futures = [
+                executor.submit(_download_feed, url, folder_name)
+                for url, folder_name in pending
+            ]
+        errors = [f.exception() for f in futures if f.exception() is not None]
+        if errors:
+            raise errors[0]
 
     print("   ✓ All GTFS data downloaded and extracted")
 
@@ -178,6 +235,24 @@ def cleanup_gtfs_data():
 # ============================================================================
 
 
+# The seed builds a throwaway database from scratch, so durability is traded
+# for load speed: if the process dies midway, the seed is simply run again
+SEED_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-200000",
+)
+
+
+def apply_seed_pragmas(dbapi_connection, connection_record=None):
+    """Relax SQLite journaling/fsync on a connection used for the bulk load."""
+    cursor = dbapi_connection.cursor()
+    for pragma in SEED_SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
 def remove_old_database():
     """Remove old database file if it exists."""
     db_file = "transportation.db"
@@ -208,20 +283,11 @@ def create_stops(db, vehicle_types):
     """Create stops (bus/tram/train) from GTFS stops.txt files."""
     print("\n🚏 Creating stops from GTFS...")
 
-    # Find vehicle types by code
-    bus_type = next(vt for vt in vehicle_types if vt.code == "BUS")
-    tram_type = next(vt for vt in vehicle_types if vt.code == "TRAM")
-    train_type = next(vt for vt in vehicle_types if vt.code == "TRAIN")
-
-    # Map folder to vehicle type
-    feeds = [
-        ("GTFS_KRK_A", bus_type),
-        ("GTFS_KRK_T", tram_type),
-        ("GTFS_KRK_M", train_type),
-    ]
+    feeds = get_vehicle_type_mapping(vehicle_types)
 
     stops = []
     total = 0
+    created_at = datetime.utcnow()
 
     for folder, vtype in feeds:
         path = os.path.join(folder, "stops.txt")
@@ -248,12 +314,14 @@ def create_stops(db, vehicle_types):
                     vehicle_type_id=vtype.id,
                     latitude=float(lat),
                     longitude=float(lon),
-                    created_at=datetime.utcnow(),
+                    created_at=created_at,
                 )
-                db.add(stop)
                 stops.append(stop)
                 total += 1
 
+    # Stop IDs come from GTFS, so the rows go in bulk without the unit of work
+    for chunk in chunked(stops):
+        db.bulk_save_objects(chunk)
     db.commit()
     print(f"   ✓ Created {len(stops)} stops (from {total} total rows read)")
     return stops
@@ -354,9 +422,10 @@ def create_vehicles(db, vehicle_types, users):
     print("\n🚗 Creating vehicles...")
 
     # Find vehicle types by code
-    bus_type = next(vt for vt in vehicle_types if vt.code == "BUS")
-    tram_type = next(vt for vt in vehicle_types if vt.code == "TRAM")
-    train_type = next(vt for vt in vehicle_types if vt.code == "TRAIN")
+    types_by_code = {vt.code: vt for vt in vehicle_types}
+    bus_type = types_by_code["BUS"]
+    tram_type = types_by_code["TRAM"]
+    train_type = types_by_code["TRAIN"]
 
     # Find drivers
     drivers = [u for u in users if u.role == "DRIVER"]
@@ -439,13 +508,33 @@ def create_vehicles(db, vehicle_types, users):
     return vehicles
 
 
-def create_routes(db, stops, vehicle_types):
+def load_stop_times(vehicle_types):
+    """
+    Read every feed's stop_times.txt once, for both routes and route stops.
+
+    Returns:
+        dict: Maps GTFS feed folder to its stop times DataFrame
+            (feeds without a stop_times.txt are left out)
+    """
+    stop_times = {}
+    for folder, _ in get_vehicle_type_mapping(vehicle_types):
+        path = os.path.join(folder, "stop_times.txt")
+        if os.path.isfile(path):
+            print(f"   • Reading stop times from {folder}...")
+            stop_times[folder] = read_stop_times(path)
+    return stop_times
+
+
+def create_routes(db, stops, vehicle_types, stop_times):
     """
     Create routes from GTFS trip data.
 
     A route represents a single trip with a start/end stop and scheduled times.
     Extracts trip information from GTFS stop_times.txt files.
 
+    Args:
+        stop_times: Stop times DataFrames by feed folder (from load_stop_times)
+
     Returns:
         tuple: (routes list, route_trip_mapping dict)
             - routes: List of created Route objects
@@ -460,33 +549,40 @@ def create_routes(db, stops, vehicle_types):
 
     for folder, vehicle_type in feeds:
         total_created += _process_routes_for_feed(
-            db, folder, vehicle_type, routes, route_trip_mapping
+            db,
+            folder,
+            vehicle_type,
+            stop_times.get(folder),
+            routes,
+            route_trip_mapping,
         )
 
-    # Commit routes so they get database IDs assigned
+    # Routes carry their own IDs, so they are inserted in bulk without the
+    # unit of work (and without a refresh per row when their IDs are read)
+    for chunk in chunked(routes):
+        db.bulk_save_objects(chunk)
     db.commit()
 
     print(f"   ✓ Created {len(routes)} routes (from {total_created} GTFS trips)")
     return routes, route_trip_mapping
 
 
-def _process_routes_for_feed(db, folder, vehicle_type, routes, route_trip_mapping):
+def _process_routes_for_feed(
+    db, folder, vehicle_type, stop_times_df, routes, route_trip_mapping
+):
     """
     Process routes from a single GTFS feed folder.
 
     Returns:
         int: Number of routes created
     """
-    stop_times_path = os.path.join(folder, "stop_times.txt")
-
-    if not os.path.isfile(stop_times_path):
+    if stop_times_df is None:
         print(f"   • Skipping {folder}: stop_times.txt not found")
         return 0
 
     print(f"   • Processing routes from {folder}...")
 
-    # Load and aggregate trip data
-    stop_times_df = pd.read_csv(stop_times_path)
+    # Aggregate trip data
     trip_aggregates = (
         stop_times_df.sort_values(["trip_id", "stop_sequence"])
         .groupby("trip_id")
@@ -500,23 +596,27 @@ def _process_routes_for_feed(db, folder, vehicle_type, routes, route_trip_mappin
     )
 
     # Filter for valid trips (both stops exist in our database for this vehicle type)
-    valid_trips = _get_valid_trips(trip_aggregates, vehicle_type.id)
+    valid_trips = _get_valid_trips(db, trip_aggregates, vehicle_type.id)
+    for column in ("scheduled_arrival", "scheduled_departure"):
+        valid_trips[column] = parse_gtfs_times(valid_trips[column])
 
     # Create Route objects
     count = 0
-    for trip_data in tqdm(valid_trips):
+    for trip_data in tqdm(
+        valid_trips.itertuples(index=False, name=None), total=len(valid_trips)
+    ):
         trip_id, start_stop_id, end_stop_id, arrival_time, departure_time = trip_data
 
         route = Route(
+            id=generate_uuid(),
             vehicle_id=vehicle_type.id,
             starting_stop_id=start_stop_id,
             ending_stop_id=end_stop_id,
-            scheduled_arrival=parse_gtfs_time(arrival_time),
-            scheduled_departure=parse_gtfs_time(departure_time),
+            scheduled_arrival=arrival_time,
+            scheduled_departure=departure_time,
             current_status="PLANNED",
         )
 
-        db.add(route)
         routes.append(route)
         route_trip_mapping[trip_id] = route
         count += 1
@@ -524,48 +624,32 @@ def _process_routes_for_feed(db, folder, vehicle_type, routes, route_trip_mappin
     return count
 
 
-def _get_valid_trips(trip_aggregates, vehicle_type_id):
+def _get_stop_ids(db, vehicle_type_id):
+    """Get the IDs of all stops of one vehicle type, as a set."""
+    rows = db.query(Stop.id).filter(Stop.vehicle_type_id == vehicle_type_id)
+    return {stop_id for (stop_id,) in rows}
+
+
+def _get_valid_trips(db, trip_aggregates, vehicle_type_id):
     """
     Filter trips to only include those with valid stops in the database.
 
-    Uses SQLite to efficiently join trip data with existing stops.
+    Both ends are matched against the vehicle type's stop IDs in memory.
 
     Returns:
-        list: List of tuples (trip_id, start_stop, end_stop, arrival, departure)
+        DataFrame: Columns (trip_id, starting_stop, ending_stop,
+            scheduled_arrival, scheduled_departure)
     """
-    conn = sqlite3.connect("transportation.db")
-
-    with conn:
-        # Create temporary table
-        trip_aggregates.to_sql(
-            "temp_trip_stops", conn, if_exists="replace", index=False
-        )
+    stop_ids = _get_stop_ids(db, vehicle_type_id)
+    starts_valid = trip_aggregates["starting_stop"].isin(stop_ids)
+    ends_valid = trip_aggregates["ending_stop"].isin(stop_ids)
 
-        # Query for trips where both start and end stops exist
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT
-                t.trip_id,
-                t.starting_stop,
-                t.ending_stop,
-                t.scheduled_arrival,
-                t.scheduled_departure
-            FROM temp_trip_stops t
-            INNER JOIN stops s1 ON t.starting_stop = s1.id
-            INNER JOIN stops s2 ON t.ending_stop = s2.id
-            WHERE s1.vehicle_type_id = ?
-              AND s2.vehicle_type_id = ?
-        """,
-            (vehicle_type_id, vehicle_type_id),
-        )
-
-        return cursor.fetchall()
+    return trip_aggregates[starts_valid & ends_valid].reset_index(drop=True)
 
-    conn.close()
 
-
-def create_route_stops(db, routes, stops, vehicle_types, route_trip_mapping):
+def create_route_stops(
+    db, routes, stops, vehicle_types, route_trip_mapping, stop_times
+):
     """
     Create route-stop associations from GTFS data.
 
@@ -574,9 +658,10 @@ def create_route_stops(db, routes, stops, vehicle_types, route_trip_mapping):
 
     Args:
         route_trip_mapping: Maps GTFS trip_id to Route objects (from create_routes)
+        stop_times: Stop times DataFrames by feed folder (from load_stop_times)
 
     Returns:
-        list: Created RouteStop objects
+        list: Created route stop rows (column dicts)
     """
     print("\n📍 Creating route stops from GTFS data...")
 
@@ -586,20 +671,27 @@ def create_route_stops(db, routes, stops, vehicle_types, route_trip_mapping):
 
     for folder, vehicle_type in feeds:
         stops_created, trips_skipped = _process_route_stops_for_feed(
-            db, folder, vehicle_type, route_trip_mapping, route_stops
+            db,
+            folder,
+            vehicle_type,
+            stop_times.get(folder),
+            route_trip_mapping,
+            route_stops,
         )
         total_created += stops_created
 
         if trips_skipped > 0:
             print(f"   ⚠️  Skipped {trips_skipped} trips with no matching route")
 
+    for chunk in chunked(route_stops):
+        db.bulk_insert_mappings(RouteStop, chunk)
     db.commit()
     print(f"   ✓ Created {total_created} route stops")
     return route_stops
 
 
 def _process_route_stops_for_feed(
-    db, folder, vehicle_type, route_trip_mapping, route_stops
+    db, folder, vehicle_type, stop_times_df, route_trip_mapping, route_stops
 ):
     """
     Process route stops from a single GTFS feed folder.
@@ -607,27 +699,27 @@ def _process_route_stops_for_feed(
     Returns:
         tuple: (stops_created, trips_skipped)
     """
-    stop_times_path = os.path.join(folder, "stop_times.txt")
-
-    if not os.path.isfile(stop_times_path):
+    if stop_times_df is None:
         print(f"   • Skipping {folder}: stop_times.txt not found")
         return 0, 0
 
     print(f"   • Processing route stops from {folder}...")
 
-    # Load stop times data
-    stop_times_df = pd.read_csv(stop_times_path)
-
     # Get valid stop times (stops that exist in our database)
-    valid_stop_times = _get_valid_stop_times(stop_times_df, vehicle_type.id)
+    valid_stop_times = _get_valid_stop_times(db, stop_times_df, vehicle_type.id)
+    for column in ("arrival_time", "departure_time"):
+        valid_stop_times[column] = parse_gtfs_times(valid_stop_times[column])
 
-    # Create RouteStop objects
+    # Build route stop rows; they are inserted in bulk by the caller
     stops_created = 0
     trips_skipped = set()
     current_trip_id = None
     current_route = None
 
-    for stop_data in tqdm(valid_stop_times):
+    for stop_data in tqdm(
+        valid_stop_times.itertuples(index=False, name=None),
+        total=len(valid_stop_times),
+    ):
         trip_id, stop_id, arrival_time, departure_time, stop_sequence = stop_data
 
         # Check if we've moved to a new trip
@@ -641,57 +733,36 @@ def _process_route_stops_for_feed(
 
         # Only create route stop if we have a valid route
         if current_route:
-            route_stop = RouteStop(
-                route_id=current_route.id,
-                stop_id=stop_id,
-                scheduled_arrival=parse_gtfs_time(arrival_time),
-                scheduled_departure=parse_gtfs_time(departure_time),
-                stop_sequence=stop_sequence,
+            route_stops.append(
+                {
+                    "route_id": current_route.id,
+                    "stop_id": stop_id,
+                    "scheduled_arrival": arrival_time,
+                    "scheduled_departure": departure_time,
+                    "stop_sequence": stop_sequence,
+                }
             )
-
-            db.add(route_stop)
-            route_stops.append(route_stop)
             stops_created += 1
 
     return stops_created, len(trips_skipped)
 
 
-def _get_valid_stop_times(stop_times_df, vehicle_type_id):
+def _get_valid_stop_times(db, stop_times_df, vehicle_type_id):
     """
     Filter stop times to only include stops that exist in the database.
 
-    Uses SQLite to efficiently join stop_times with existing stops.
+    Stops are matched against the vehicle type's stop IDs in memory.
 
     Returns:
-        list: List of tuples (trip_id, stop_id, arrival_time, departure_time, stop_sequence)
+        DataFrame: Columns (trip_id, stop_id, arrival_time, departure_time,
+            stop_sequence), ordered by trip and stop sequence
     """
-    conn = sqlite3.connect("transportation.db")
-
-    with conn:
-        # Create temporary table
-        stop_times_df.to_sql("temp_stop_times", conn, if_exists="replace", index=False)
-
-        # Query for stop times where the stop exists in our database
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT
-                st.trip_id,
-                st.stop_id,
-                st.arrival_time,
-                st.departure_time,
-                st.stop_sequence
-            FROM temp_stop_times st
-            INNER JOIN stops s ON st.stop_id = s.id
-            WHERE s.vehicle_type_id = ?
-            ORDER BY st.trip_id, st.stop_sequence
-        """,
-            (vehicle_type_id,),
-        )
+    stop_ids = _get_stop_ids(db, vehicle_type_id)
+    columns = ["trip_id", "stop_id", "arrival_time", "departure_time", "stop_sequence"]
+    valid_stop_times = stop_times_df[stop_times_df["stop_id"].isin(stop_ids)]
 
-        return cursor.fetchall()
-
-    conn.close()
+    ordered = valid_stop_times.sort_values(["trip_id", "stop_sequence"])
+    return ordered[columns].reset_index(drop=True)
 
 
 def create_journeys(db, routes, users):
@@ -1218,6 +1289,10 @@ def seed_database(keep_gtfs_data=False):
         remove_old_database()
 
         print("\n📦 Creating new database...")
+        # Every pooled connection opened from here on gets the bulk-load PRAGMAs
+        if engine.dialect.name == "sqlite":
+            event.listen(engine, "connect", apply_seed_pragmas)
+
         # Initialize database structure
         init_db()
         print("   ✓ Database structure created")
@@ -1233,10 +1308,14 @@ def seed_database(keep_gtfs_data=False):
             stops = create_stops(db, vehicle_types)
             users = create_users(db)
             vehicles = create_vehicles(db, vehicle_types, users)
-            routes, route_trip_mapping = create_routes(db, stops, vehicle_types)
+            stop_times = load_stop_times(vehicle_types)
+            routes, route_trip_mapping = create_routes(
+                db, stops, vehicle_types, stop_times
+            )
             route_stops = create_route_stops(
-                db, routes, stops, vehicle_types, route_trip_mapping
+                db, routes, stops, vehicle_types, route_trip_mapping, stop_times
             )
+            del stop_times
             route_segments = []  # Not created in this seed script
             shape_points = []  # Not created in this seed script
             journeys = create_journeys(db, routes, users)
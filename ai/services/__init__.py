@@ -4,6 +4,7 @@ Services module for external integrations.
 Services:
 - whisper_service: OpenAI Whisper for speech-to-text
 - gemini_service: Google Gemini for natural language understanding
+- cache_service: Shared, connection-pooled Redis client for caching
 """
 
-__all__ = ["whisper_service", "gemini_service"]
+__all__ = ["whisper_service", "gemini_service", "cache_service"]
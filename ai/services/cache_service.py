@@ -0,0 +1,88 @@
+"""
+Redis cache service.
+
+A single pooled Redis client is created at application startup and shared by
+every request, so cache calls never open a new connection on the request path.
+
+Requirements:
+- pip install redis
+- REDIS_URL in .env (caching is disabled when not set)
+"""
+
+from typing import Optional
+
+try:
+    import redis
+except ImportError:
+    redis = None  # type: ignore
+
+from config import settings
+
+# Shared client (created once in init_redis, reused by all requests)
+_redis_client = None
+
+
+def init_redis() -> None:
+    """
+    Create the shared Redis client backed by a bounded connection pool.
+
+    No-op when the redis package is missing or REDIS_URL is not set.
+    """
+    global _redis_client
+
+    if redis is None or not settings.REDIS_URL:
+        return
+
+    pool = redis.ConnectionPool.from_url(
+        settings.REDIS_URL, max_connections=settings.REDIS_MAX_CONNECTIONS
+    )
+    _redis_client = redis.Redis(connection_pool=pool)
+    print(f"✓ Redis cache enabled ({settings.REDIS_MAX_CONNECTIONS} connections)")
+
+
+def close_redis() -> None:
+    """Close the shared client and release pooled connections."""
+    global _redis_client
+
+    if _redis_client is not None:
+        _redis_client.close()
+        _redis_client.connection_pool.disconnect()
+        _redis_client = None
+
+
+def get_redis():
+    """Return the shared Redis client, or None if caching is disabled."""
+    return _redis_client
+
+
+def cache_get(key: str) -> Optional[bytes]:
+    """Get a cached value. Redis errors are treated as a cache miss."""
+    if _redis_client is None:
+        return None
+    try:
+        return _redis_client.get(key)
+    except redis.RedisError:
+        return None
+
+
+def cache_set(key: str, value: bytes, ttl_seconds: int) -> None:
+    """Store a value with an expiry. Redis errors are ignored."""
+    if _redis_client is None:
+        return
+    try:
+        _redis_client.setex(key, ttl_seconds, value)
+    except redis.RedisError:
+        pass
+
+
+def cache_delete(*keys: str) -> None:
+    """Invalidate several keys in one round trip using a pipeline."""
+    if _redis_client is None or not keys:
+        return
+    try:
+        pipe = _redis_client.pipeline(transaction=False)
+        for key in keys:
+            pipe.delete(key)
+        pipe.execute()
+    except redis.RedisError:
+        pass
@@ -21,6 +21,31 @@ from config import settings
 from crud import stop as crud_stop
 from sqlalchemy.orm import Session
 
+# Global model cache (configure once, reuse)
+_gemini_model = None
+
+
+def _get_gemini_model():
+    """Get or create the Gemini model client (cached)."""
+    global _gemini_model
+
+    if _gemini_model is None:
+        genai.configure(api_key=settings.GEMINI_API_KEY)
+        _gemini_model = genai.GenerativeModel("gemini-pro")
+
+    return _gemini_model
+
+
+def warmup() -> None:
+    """
+    Create the cached Gemini client ahead of the first command.
+
+    Does nothing if Gemini is not installed or configured; the error is
+    reported by process_journey_command instead.
+    """
+    if genai is not None and settings.GEMINI_API_KEY:
+        _get_gemini_model()
+
 
 async def process_journey_command(command: str, user_id: str, db: Session) -> Dict:
     """
@@ -50,9 +75,7 @@ async def process_journey_command(command: str, user_id: str, db: Session) -> Di
     if not settings.GEMINI_API_KEY:
         raise ValueError("GEMINI_API_KEY not set in environment")
 
-    # Configure Gemini
-    genai.configure(api_key=settings.GEMINI_API_KEY)
-    model = genai.GenerativeModel("gemini-pro")
+    model = _get_gemini_model()
 
     # Get available stops for context
     stops = crud_stop.get_stops(db, skip=0, limit=100)
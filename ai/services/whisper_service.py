@@ -10,9 +10,11 @@ Requirements:
 No API key needed - runs 100% locally!
 """
 
+import asyncio
 import io
+import shutil
 import tempfile
-from typing import Dict
+from typing import BinaryIO, Dict
 
 try:
     import whisper
@@ -81,8 +83,16 @@ def _get_faster_whisper_model(model_size: str = "base"):
     return _faster_whisper_model
 
 
+def _write_temp_audio(audio: BinaryIO) -> str:
+    """Copy an audio upload into a temp file in chunks and return its path."""
+    audio.seek(0)
+    with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as temp_file:
+        shutil.copyfileobj(audio, temp_file, 64 * 1024)
+        return temp_file.name
+
+
 async def transcribe_audio(
-    audio_bytes: bytes,
+    audio: BinaryIO,
     filename: str,
     use_faster_whisper: bool = True,
     model_size: str = "base",
@@ -91,7 +101,7 @@ async def transcribe_audio(
     Transcribe audio to text using local Whisper model.
 
     Args:
-        audio_bytes: Raw audio file bytes
+        audio: Audio file object (e.g. the upload's spooled temp file)
         filename: Original filename (for format detection)
         use_faster_whisper: Use faster-whisper if available (4x faster!)
         model_size: Model size (tiny/base/small/medium/large)
@@ -105,22 +115,24 @@ async def transcribe_audio(
     """
     # Try faster-whisper first (if requested and available)
     if use_faster_whisper and FASTER_WHISPER_AVAILABLE:
-        return await _transcribe_with_faster_whisper(audio_bytes, filename, model_size)
+        transcribe = _transcribe_with_faster_whisper
+    else:
+        # Fallback to standard whisper
+        transcribe = _transcribe_with_standard_whisper
 
-    # Fallback to standard whisper
-    return await _transcribe_with_standard_whisper(audio_bytes, filename, model_size)
+    # Model loading and transcription block, so run them on a worker thread
+    # to keep the event loop free for other requests
+    return await asyncio.to_thread(transcribe, audio, filename, model_size)
 
 
-async def _transcribe_with_standard_whisper(
-    audio_bytes: bytes, filename: str, model_size: str
+def _transcribe_with_standard_whisper(
+    audio: BinaryIO, filename: str, model_size: str
 ) -> Dict:
     """Transcribe using standard openai-whisper."""
     model = _get_whisper_model(model_size)
 
     # Save audio to temp file (whisper needs file path)
-    with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as temp_file:
-        temp_file.write(audio_bytes)
-        temp_path = temp_file.name
+    temp_path = _write_temp_audio(audio)
 
     try:
         # Transcribe
@@ -146,16 +158,14 @@ async def _transcribe_with_standard_whisper(
             pass
 
 
-async def _transcribe_with_faster_whisper(
-    audio_bytes: bytes, filename: str, model_size: str
+def _transcribe_with_faster_whisper(
+    audio: BinaryIO, filename: str, model_size: str
 ) -> Dict:
     """Transcribe using faster-whisper (4x faster!)."""
     model = _get_faster_whisper_model(model_size)
 
     # Save audio to temp file
-    with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as temp_file:
-        temp_file.write(audio_bytes)
-        temp_path = temp_file.name
+    temp_path = _write_temp_audio(audio)
 
     try:
         # Transcribe